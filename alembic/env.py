@@ -11,6 +11,7 @@ from alembic import context
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
 from transcriptor.config import settings
+from transcriptor.db.database import FTS_TABLES, TRGM_INDEXES
 from transcriptor.db.models import Base
 
 # this is the Alembic Config object, which provides
@@ -28,6 +29,25 @@ if config.config_file_name is not None:
 # Use our models' metadata for autogenerate support
 target_metadata = Base.metadata
 
+
+def include_name(name, type_, parent_names):
+    """Keep search indexes managed by init_db() out of autogenerate."""
+    if type_ == "table" and name is not None:
+        return not any(name.startswith(fts) for fts in FTS_TABLES.values())
+    if type_ == "index":
+        return name not in TRGM_INDEXES
+    return True
+
+
+def include_object(object_, name, type_, reflected, compare_to):
+    """Skip dialect-restricted indexes (``Index.ddl_if``) on other dialects."""
+    ddl_if = getattr(object_, "_ddl_if", None)
+    if type_ == "index" and not reflected and ddl_if is not None and ddl_if.dialect:
+        dialects = {ddl_if.dialect} if isinstance(ddl_if.dialect, str) else set(ddl_if.dialect)
+        return context.get_context().dialect.name in dialects
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -50,6 +70,8 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -73,7 +95,10 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
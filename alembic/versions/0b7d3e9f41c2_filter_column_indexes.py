@@ -0,0 +1,43 @@
+"""filter_column_indexes
+
+Revision ID: 0b7d3e9f41c2
+Revises: fd542a62e778
+Create Date: 2026-10-15 09:47:05.602118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b7d3e9f41c2'
+down_revision: Union[str, Sequence[str], None] = 'fd542a62e778'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_recordings_status', 'recordings', ['status'], unique=False)
+    op.create_index('ix_recordings_created_at', 'recordings', ['created_at'], unique=False)
+    op.create_index('ix_transcripts_recording_id', 'transcripts', ['recording_id'], unique=False)
+    op.create_index('ix_segments_transcript_id_start', 'segments', ['transcript_id', 'start_time'], unique=False)
+    op.create_index('ix_speakers_role', 'speakers', ['role'], unique=False)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index(
+            'ix_speakers_label_pattern', 'speakers', ['label'], unique=False,
+            postgresql_ops={'label': 'text_pattern_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_speakers_label_pattern', table_name='speakers')
+    op.drop_index('ix_speakers_role', table_name='speakers')
+    op.drop_index('ix_segments_transcript_id_start', table_name='segments')
+    op.drop_index('ix_transcripts_recording_id', table_name='transcripts')
+    op.drop_index('ix_recordings_created_at', table_name='recordings')
+    op.drop_index('ix_recordings_status', table_name='recordings')
@@ -0,0 +1,30 @@
+"""recordings_status_filename_index
+
+Revision ID: 3a8d5f0e6c21
+Revises: 9e4f2a7c1b36
+Create Date: 2026-10-15 22:04:37.118520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a8d5f0e6c21'
+down_revision: Union[str, Sequence[str], None] = '9e4f2a7c1b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_recordings_status_filename', 'recordings', ['status', 'filename'], unique=False)
+    op.drop_index('ix_recordings_status', table_name='recordings')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_recordings_status', 'recordings', ['status'], unique=False)
+    op.drop_index('ix_recordings_status_filename', table_name='recordings')
@@ -0,0 +1,66 @@
+"""cascade_deletes
+
+Revision ID: 5c21e8a9d470
+Revises: 0b7d3e9f41c2
+Create Date: 2026-10-15 21:20:41.318604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c21e8a9d470'
+down_revision: Union[str, Sequence[str], None] = '0b7d3e9f41c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The initial schema created these foreign keys unnamed; this convention
+# lets batch mode (SQLite table rebuild) find them by name.
+naming_convention = {
+    'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s',
+}
+
+# Expression indexes that SQLite's batch table rebuild cannot reflect and
+# would silently drop; recreated afterwards.
+sqlite_expression_indexes = (
+    ('ix_transcripts_full_text_lower', 'transcripts', 'lower(full_text)'),
+    ('ix_segments_text_lower', 'segments', 'lower(text)'),
+)
+
+# (table, column, referred table)
+foreign_keys = (
+    ('transcripts', 'recording_id', 'recordings'),
+    ('segments', 'transcript_id', 'transcripts'),
+)
+
+
+def _existing_fk_name(table: str, column: str, referred: str) -> str:
+    if op.get_bind().dialect.name == 'postgresql':
+        return f'{table}_{column}_fkey'
+    return f'fk_{table}_{column}_{referred}'
+
+
+def _replace_foreign_keys(ondelete: Union[str, None]) -> None:
+    for table, column, referred in foreign_keys:
+        name = _existing_fk_name(table, column, referred)
+        with op.batch_alter_table(table, naming_convention=naming_convention) as batch_op:
+            batch_op.drop_constraint(name, type_='foreignkey')
+            batch_op.create_foreign_key(
+                name, referred, [column], ['id'], ondelete=ondelete,
+            )
+    if op.get_bind().dialect.name == 'sqlite':
+        for name, table, expr in sqlite_expression_indexes:
+            op.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {table} ({expr})')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_foreign_keys('CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_foreign_keys(None)
@@ -0,0 +1,31 @@
+"""recordings_content_hash
+
+Revision ID: 7d2b4f6e9a13
+Revises: c4e19b7a2d85
+Create Date: 2026-10-15 23:02:11.406385
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2b4f6e9a13'
+down_revision: Union[str, Sequence[str], None] = 'c4e19b7a2d85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('recordings', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index('ix_recordings_content_hash', 'recordings', ['content_hash'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_recordings_content_hash', table_name='recordings')
+    with op.batch_alter_table('recordings') as batch_op:
+        batch_op.drop_column('content_hash')
@@ -0,0 +1,38 @@
+"""recordings_daily
+
+Revision ID: 9e4f2a7c1b36
+Revises: 5c21e8a9d470
+Create Date: 2026-10-15 21:41:12.907355
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4f2a7c1b36'
+down_revision: Union[str, Sequence[str], None] = '5c21e8a9d470'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('recordings_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+    # Backfill from existing recordings; the app keeps it current from here
+    op.execute(
+        'INSERT INTO recordings_daily (day, count) '
+        'SELECT date(created_at), count(id) FROM recordings '
+        'WHERE created_at IS NOT NULL GROUP BY date(created_at)'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('recordings_daily')
@@ -0,0 +1,41 @@
+"""created_at_server_default
+
+Revision ID: c4e19b7a2d85
+Revises: 3a8d5f0e6c21
+Create Date: 2026-10-15 22:18:52.604117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e19b7a2d85'
+down_revision: Union[str, Sequence[str], None] = '3a8d5f0e6c21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The application no longer supplies created_at; the database does
+    with op.batch_alter_table('recordings') as batch_op:
+        batch_op.alter_column(
+            'created_at',
+            existing_type=sa.DateTime(),
+            existing_nullable=True,
+            server_default=sa.func.now(),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('recordings') as batch_op:
+        batch_op.alter_column(
+            'created_at',
+            existing_type=sa.DateTime(),
+            existing_nullable=True,
+            server_default=None,
+        )
@@ -0,0 +1,35 @@
+"""search_lower_indexes
+
+Revision ID: fd542a62e778
+Revises: 36bec997b605
+Create Date: 2026-10-15 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fd542a62e778'
+down_revision: Union[str, Sequence[str], None] = '36bec997b605'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # lower(...) expression indexes are SQLite-only (see db/models.py)
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    op.create_index('ix_transcripts_full_text_lower', 'transcripts', [sa.text('lower(full_text)')], unique=False)
+    op.create_index('ix_segments_text_lower', 'segments', [sa.text('lower(text)')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    op.drop_index('ix_segments_text_lower', table_name='segments')
+    op.drop_index('ix_transcripts_full_text_lower', table_name='transcripts')
@@ -1,17 +1,48 @@
-"""Query interface for accessing transcription data."""
+"""Query interface for accessing transcription data.
+
+The database must already be initialised (``init_db``) by the entry point.
+"""
+
+from sqlalchemy import case, func, literal, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import raiseload, selectinload
+
+from transcriptor.db.database import (
+    SEARCH_RESULT_LIMIT,
+    SessionLocal,
+    fts_enabled,
+    fts_match_ids,
+    search_snippet,
+    speaker_roles,
+)
+from transcriptor.db.models import Recording, Segment, Speaker, Transcript
 
-from sqlalchemy import func
+# Statement skeletons built once; per-call .where() clauses reuse their
+# compiled form from SQLAlchemy's statement cache.
+_RECORDING_WITH_SEGMENTS = select(Recording).options(
+    selectinload(Recording.transcripts).selectinload(Transcript.segments)
+)
 
-from transcriptor.db.database import SessionLocal, init_db
-from transcriptor.db.models import Recording, Segment, Speaker, Transcript
+# swap_speakers() rewrites segments and full_text with UPDATEs, so it only
+# needs the id -- not the transcript row, full_text and segments included.
+_FIRST_TRANSCRIPT_ID = select(Transcript.id).order_by(Transcript.id).limit(1)
+
+# Listings only need recording columns; any relationship access is a bug
+_RECORDINGS = select(Recording).options(raiseload("*")).order_by(Recording.id.desc())
+
+_STATUS_TOTALS = select(
+    Recording.status,
+    func.count(Recording.id),
+    func.sum(Recording.duration_seconds),
+    func.count(Recording.duration_seconds),
+).group_by(Recording.status)
 
 
 def get_all_recordings() -> list[dict]:
     """List all recordings with their status."""
-    init_db()
     session = SessionLocal()
     try:
-        recordings = session.query(Recording).order_by(Recording.id.desc()).all()
+        recordings = session.scalars(_RECORDINGS).all()
         return [
             {
                 "id": r.id,
@@ -30,18 +61,15 @@ def get_all_recordings() -> list[dict]:
 
 def get_transcript(recording_id: int) -> dict | None:
     """Get full transcript with segments for a recording."""
-    init_db()
     session = SessionLocal()
     try:
-        recording = session.get(Recording, recording_id)
+        recording = session.scalars(
+            _RECORDING_WITH_SEGMENTS.where(Recording.id == recording_id)
+        ).one_or_none()
         if not recording:
             return None
 
-        transcript = (
-            session.query(Transcript)
-            .filter(Transcript.recording_id == recording_id)
-            .first()
-        )
+        transcript = recording.transcripts[0] if recording.transcripts else None
         if not transcript:
             return {
                 "recording": {
@@ -53,20 +81,7 @@ def get_transcript(recording_id: int) -> dict | None:
                 "segments": [],
             }
 
-        segments = (
-            session.query(Segment)
-            .filter(Segment.transcript_id == transcript.id)
-            .order_by(Segment.start_time)
-            .all()
-        )
-
-        # Build speaker_label -> role mapping
-        speaker_labels = {s.speaker_label for s in segments if s.speaker_label}
-        role_map = {}
-        if speaker_labels:
-            speakers = session.query(Speaker).filter(Speaker.label.in_(speaker_labels)).all()
-            role_map = {sp.label: sp.role for sp in speakers}
-
+        roles = speaker_roles(session)
         return {
             "recording": {
                 "id": recording.id,
@@ -83,12 +98,12 @@ def get_transcript(recording_id: int) -> dict | None:
                 {
                     "id": s.id,
                     "speaker": s.speaker_label,
-                    "role": role_map.get(s.speaker_label),
+                    "role": roles.get(s.speaker_label),
                     "text": s.text,
                     "start_time": s.start_time,
                     "end_time": s.end_time,
                 }
-                for s in segments
+                for s in transcript.segments
             ],
         }
     finally:
@@ -97,52 +112,75 @@ def get_transcript(recording_id: int) -> dict | None:
 
 def search_transcripts(query: str) -> list[dict]:
     """Full-text search across all transcripts and segments."""
-    init_db()
     session = SessionLocal()
     try:
-        pattern = f"%{query}%"
-
-        # Search in full transcript text
-        transcript_hits = (
-            session.query(Transcript, Recording)
+        if fts_enabled():
+            transcript_filter = Transcript.id.in_(
+                fts_match_ids(session, "transcripts", query, SEARCH_RESULT_LIMIT)
+            )
+            segment_filter = Segment.id.in_(
+                fts_match_ids(session, "segments", query, SEARCH_RESULT_LIMIT)
+            )
+        else:
+            # Lower-case the needle once; the column side matches the
+            # lower(...) expression indexes on SQLite.
+            pattern = f"%{query.lower()}%"
+            transcript_filter = func.lower(Transcript.full_text).like(pattern)
+            segment_filter = func.lower(Segment.text).like(pattern)
+
+        # Search in full transcript text; only a snippet around the match
+        # is returned, not the whole (possibly very long) transcript.
+        transcript_hits = session.execute(
+            select(
+                Recording.id,
+                Recording.filename,
+                search_snippet(Transcript.full_text, query).label("snippet"),
+            )
             .join(Recording, Transcript.recording_id == Recording.id)
-            .filter(Transcript.full_text.ilike(pattern))
-            .all()
-        )
+            .where(transcript_filter)
+            .limit(SEARCH_RESULT_LIMIT)
+        ).all()
 
         # Search in individual segments
-        segment_hits = (
-            session.query(Segment, Transcript, Recording)
+        segment_hits = session.execute(
+            select(
+                Recording.id,
+                Recording.filename,
+                Segment.speaker_label,
+                Segment.text,
+                Segment.start_time,
+                Segment.end_time,
+            )
             .join(Transcript, Segment.transcript_id == Transcript.id)
             .join(Recording, Transcript.recording_id == Recording.id)
-            .filter(Segment.text.ilike(pattern))
-            .all()
-        )
+            .where(segment_filter)
+            .limit(SEARCH_RESULT_LIMIT)
+        ).all()
 
         results = []
         seen_recording_ids = set()
 
-        for transcript, recording in transcript_hits:
-            seen_recording_ids.add(recording.id)
+        for recording_id, filename, snippet in transcript_hits:
+            seen_recording_ids.add(recording_id)
             results.append(
                 {
-                    "recording_id": recording.id,
-                    "filename": recording.filename,
+                    "recording_id": recording_id,
+                    "filename": filename,
                     "match_type": "transcript",
-                    "text": transcript.full_text,
+                    "text": snippet,
                 }
             )
 
-        for segment, transcript, recording in segment_hits:
+        for recording_id, filename, speaker, text, start_time, end_time in segment_hits:
             results.append(
                 {
-                    "recording_id": recording.id,
-                    "filename": recording.filename,
+                    "recording_id": recording_id,
+                    "filename": filename,
                     "match_type": "segment",
-                    "speaker": segment.speaker_label,
-                    "text": segment.text,
-                    "start_time": segment.start_time,
-                    "end_time": segment.end_time,
+                    "speaker": speaker,
+                    "text": text,
+                    "start_time": start_time,
+                    "end_time": end_time,
                 }
             )
 
@@ -156,37 +194,18 @@ def get_segments_by_speaker(recording_id: int, role: str) -> list[dict]:
 
     Joins Segment.speaker_label with Speaker.label to resolve role.
     """
-    init_db()
     session = SessionLocal()
     try:
-        transcript = (
-            session.query(Transcript)
-            .filter(Transcript.recording_id == recording_id)
-            .first()
-        )
-        if not transcript:
-            return []
-
-        # Find speaker labels matching the requested role
-        matching_speakers = (
-            session.query(Speaker.label)
-            .filter(Speaker.role == role)
-            .all()
-        )
-        matching_labels = {sp.label for sp in matching_speakers}
-
-        if not matching_labels:
-            return []
-
-        segments = (
-            session.query(Segment)
-            .filter(
-                Segment.transcript_id == transcript.id,
-                Segment.speaker_label.in_(matching_labels),
+        segments = session.scalars(
+            select(Segment)
+            .join(Segment.speaker)
+            .join(Segment.transcript)
+            .where(
+                Transcript.recording_id == recording_id,
+                Speaker.role == role,
             )
             .order_by(Segment.start_time)
-            .all()
-        )
+        ).all()
 
         return [
             {
@@ -203,39 +222,58 @@ def get_segments_by_speaker(recording_id: int, role: str) -> list[dict]:
         session.close()
 
 
+def _full_text_select(session, transcript_id: int):
+    """SELECT rebuilding ``"[Label] text"`` lines of a transcript, in time order, in SQL."""
+    label = Segment.speaker_label
+    line = (
+        "[" + func.upper(func.substr(label, 1, 1)) + func.lower(func.substr(label, 2))
+        + "] " + Segment.text
+    )
+    if session.get_bind().dialect.name == "postgresql":
+        joined = func.string_agg(line, aggregate_order_by(literal("\n"), Segment.start_time))
+        return select(func.coalesce(joined, "")).where(Segment.transcript_id == transcript_id)
+
+    # SQLite's group_concat follows the order of the (ordered) subquery
+    lines = (
+        select(line.label("line"))
+        .where(Segment.transcript_id == transcript_id)
+        .order_by(Segment.start_time)
+        .subquery()
+    )
+    return select(func.coalesce(func.group_concat(lines.c.line, "\n"), ""))
+
+
 def swap_speakers(recording_id: int) -> bool:
     """Swap agent/customer labels for all segments of a recording.
 
     Returns True if swap was performed, False if recording/transcript not found.
     """
-    init_db()
     session = SessionLocal()
     try:
-        transcript = (
-            session.query(Transcript)
-            .filter(Transcript.recording_id == recording_id)
-            .first()
+        transcript_id = session.scalar(
+            _FIRST_TRANSCRIPT_ID.where(Transcript.recording_id == recording_id)
         )
-        if not transcript:
+        if transcript_id is None:
             return False
 
-        segments = (
-            session.query(Segment)
-            .filter(Segment.transcript_id == transcript.id)
-            .all()
+        session.execute(
+            update(Segment)
+            .where(Segment.transcript_id == transcript_id)
+            .values(
+                speaker_label=case(
+                    (Segment.speaker_label == "agent", "customer"),
+                    (Segment.speaker_label == "customer", "agent"),
+                    else_=Segment.speaker_label,
+                )
+            )
         )
 
-        swap_map = {"agent": "customer", "customer": "agent"}
-        for seg in segments:
-            seg.speaker_label = swap_map.get(seg.speaker_label, seg.speaker_label)
-
         # Rebuild full_text with swapped labels
-        ordered = sorted(segments, key=lambda s: s.start_time or 0)
-        lines = []
-        for seg in ordered:
-            label = seg.speaker_label.capitalize()
-            lines.append(f"[{label}] {seg.text}")
-        transcript.full_text = "\n".join(lines)
+        session.execute(
+            update(Transcript)
+            .where(Transcript.id == transcript_id)
+            .values(full_text=_full_text_select(session, transcript_id).scalar_subquery())
+        )
 
         session.commit()
         return True
@@ -245,39 +283,20 @@ def swap_speakers(recording_id: int) -> bool:
 
 def get_stats() -> dict:
     """Get overall statistics: total recordings, avg duration, processing info."""
-    init_db()
     session = SessionLocal()
     try:
-        total = session.query(func.count(Recording.id)).scalar() or 0
-        done = (
-            session.query(func.count(Recording.id))
-            .filter(Recording.status == "done")
-            .scalar()
-            or 0
-        )
-        pending = (
-            session.query(func.count(Recording.id))
-            .filter(Recording.status == "pending")
-            .scalar()
-            or 0
-        )
-        errors = (
-            session.query(func.count(Recording.id))
-            .filter(Recording.status == "error")
-            .scalar()
-            or 0
-        )
-        avg_duration = (
-            session.query(func.avg(Recording.duration_seconds))
-            .filter(Recording.duration_seconds.isnot(None))
-            .scalar()
-        )
+        # Counts and duration totals for every status in one grouped query
+        status_rows = session.execute(_STATUS_TOTALS).all()
+        by_status = {status: count for status, count, _, _ in status_rows}
+        duration_sum = sum(dur_sum or 0.0 for _, _, dur_sum, _ in status_rows)
+        duration_count = sum(dur_count for _, _, _, dur_count in status_rows)
+        avg_duration = duration_sum / duration_count if duration_count else None
 
         return {
-            "total_recordings": total,
-            "done": done,
-            "pending": pending,
-            "errors": errors,
+            "total_recordings": sum(by_status.values()),
+            "done": by_status.get("done", 0),
+            "pending": by_status.get("pending", 0),
+            "errors": by_status.get("error", 0),
             "avg_duration_seconds": round(avg_duration, 2) if avg_duration else None,
         }
     finally:
@@ -5,24 +5,80 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import queue
 import shutil
 import threading
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-
-from fastapi import FastAPI, File, HTTPException, Query, UploadFile
+from typing import Any, Optional
+
+import orjson
+from fastapi import (
+    Depends,
+    FastAPI,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from sqlalchemy import func
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi.staticfiles import StaticFiles
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session, raiseload, selectinload
+from watchdog.observers import Observer
 
 from transcriptor.config import settings
-from transcriptor.db.database import SessionLocal, init_db
-from transcriptor.db.models import Recording, Segment, Speaker, Transcript
+from transcriptor.db.database import (
+    SEARCH_RESULT_LIMIT,
+    SessionLocal,
+    fts_enabled,
+    fts_match_ids,
+    init_db,
+    search_snippet,
+    speaker_roles,
+)
+from transcriptor.db.models import Recording, RecordingDaily, Segment, Transcript
+# Cheap to import: the Whisper/pyannote pipeline is only loaded once a file
+# is actually processed.
+from transcriptor.watcher.folder_watcher import (
+    WavFileHandler,
+    _process_file,
+    _shared_pipeline,
+    forget_recording,
+)
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Transcriptor API", version="0.1.0")
+
+class ORJSONResponse(JSONResponse):
+    """JSON response encoded with orjson (native datetime support, ~3-5x faster).
+
+    Defined here rather than using ``fastapi.responses.ORJSONResponse``,
+    which newer FastAPI releases deprecate.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+@asynccontextmanager
+async def _lifespan(app_instance: FastAPI):
+    # Create tables/search indexes once per process, not per request
+    init_db()
+    yield
+
+
+app = FastAPI(
+    title="Transcriptor API",
+    version="0.1.0",
+    lifespan=_lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -39,10 +95,17 @@ app.add_middleware(
 _watcher_thread: Optional[threading.Thread] = None
 _watcher_observer = None
 _watcher_stop_event = threading.Event()
+_watcher_queue = None
 
 # WebSocket clients for progress broadcasting
 _ws_clients: list = []
 
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+# /api/stats response cache: (monotonic timestamp, payload)
+_STATS_TTL_SECONDS = 5.0
+_stats_cache: Optional[tuple[float, dict]] = None
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -50,13 +113,48 @@ _ws_clients: list = []
 
 
 def _get_db():
-    session = SessionLocal()
+    """Yield a request-scoped session (FastAPI dependency).
+
+    Taken from the underlying factory rather than the thread-local registry:
+    FastAPI may run a sync dependency's setup and teardown on different
+    threadpool workers, so ``SessionLocal.remove()`` here could close a
+    session another request is still using.
+    """
+    session = SessionLocal.session_factory()
     try:
         yield session
     finally:
         session.close()
 
 
+def _select(*entities):
+    """Start a select whose relationships raise unless explicitly eager-loaded.
+
+    Guards read endpoints against silently falling back to per-row lazy
+    loads (N+1); callers opt in with ``selectinload``/``joinedload``.
+    """
+    return select(*entities).options(raiseload("*"))
+
+
+# Statement skeletons built once at import; per-request .where() clauses
+# hit SQLAlchemy's compiled-statement cache.
+_RECORDING = _select(Recording)
+
+_RECORDING_WITH_SEGMENTS = _RECORDING.options(
+    selectinload(Recording.transcripts).selectinload(Transcript.segments)
+)
+
+# The segment total rides along on every status row: there is a row
+# whenever recordings (and so any segments) exist.
+_STATUS_TOTALS = select(
+    Recording.status,
+    func.count(Recording.id),
+    func.sum(Recording.duration_seconds),
+    func.count(Recording.duration_seconds),
+    select(func.count(Segment.id)).scalar_subquery(),
+).group_by(Recording.status)
+
+
 def _recording_to_dict(r: Recording) -> dict:
     return {
         "id": r.id,
@@ -65,8 +163,21 @@ def _recording_to_dict(r: Recording) -> dict:
         "status": r.status,
         "duration": r.duration_seconds,
         "error_message": r.error_message,
-        "created_at": r.created_at.isoformat() if r.created_at else None,
-        "processed_at": r.processed_at.isoformat() if r.processed_at else None,
+        # orjson serializes datetimes natively (ISO 8601)
+        "created_at": r.created_at,
+        "processed_at": r.processed_at,
+    }
+
+
+def _segment_to_dict(s: Segment, roles: dict) -> dict:
+    return {
+        "id": s.id,
+        "speaker": s.speaker_label,
+        "role": roles.get(s.speaker_label),
+        "text": s.text,
+        "start_time": s.start_time,
+        "end_time": s.end_time,
+        "confidence": s.confidence,
     }
 
 
@@ -81,156 +192,96 @@ def list_recordings(
     sort: str = Query("date_desc", description="Sort order: date_asc, date_desc"),
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=200),
+    session: Session = Depends(_get_db),
 ):
     """List all recordings with pagination and filtering."""
-    init_db()
-    session = SessionLocal()
-    try:
-        q = session.query(Recording)
+    stmt = _RECORDING
+    count_stmt = select(func.count(Recording.id))
 
-        if status:
-            q = q.filter(Recording.status == status)
+    if status:
+        stmt = stmt.where(Recording.status == status)
+        count_stmt = count_stmt.where(Recording.status == status)
 
-        if sort == "date_asc":
-            q = q.order_by(Recording.created_at.asc())
-        else:
-            q = q.order_by(Recording.created_at.desc())
+    if sort == "date_asc":
+        stmt = stmt.order_by(Recording.created_at.asc())
+    else:
+        stmt = stmt.order_by(Recording.created_at.desc())
 
-        total = q.count()
-        recordings = q.offset((page - 1) * per_page).limit(per_page).all()
+    total = session.scalar(count_stmt)
+    recordings = session.scalars(
+        stmt.offset((page - 1) * per_page).limit(per_page)
+    ).all()
 
-        return {
-            "recordings": [_recording_to_dict(r) for r in recordings],
-            "total": total,
-            "page": page,
-            "per_page": per_page,
-            "total_pages": max(1, (total + per_page - 1) // per_page),
-        }
-    finally:
-        session.close()
+    return {
+        "recordings": [_recording_to_dict(r) for r in recordings],
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "total_pages": max(1, (total + per_page - 1) // per_page),
+    }
 
 
 @app.get("/api/recordings/{recording_id}")
-def get_recording(recording_id: int):
+def get_recording(recording_id: int, session: Session = Depends(_get_db)):
     """Get a single recording with full transcript and segments."""
-    init_db()
-    session = SessionLocal()
-    try:
-        recording = session.get(Recording, recording_id)
-        if not recording:
-            raise HTTPException(status_code=404, detail="Recording not found")
-
-        transcript = (
-            session.query(Transcript)
-            .filter(Transcript.recording_id == recording_id)
-            .first()
-        )
+    recording = session.scalars(
+        _RECORDING_WITH_SEGMENTS.where(Recording.id == recording_id)
+    ).one_or_none()
+    if not recording:
+        raise HTTPException(status_code=404, detail="Recording not found")
+
+    transcript = recording.transcripts[0] if recording.transcripts else None
+
+    segments = []
+    transcript_dict = None
+    if transcript:
+        transcript_dict = {
+            "id": transcript.id,
+            "full_text": transcript.full_text,
+            "language": transcript.language,
+            "model_used": transcript.model_used,
+        }
+        roles = speaker_roles(session)
+        segments = [_segment_to_dict(s, roles) for s in transcript.segments]
 
-        segments = []
-        transcript_dict = None
-        if transcript:
-            transcript_dict = {
-                "id": transcript.id,
-                "full_text": transcript.full_text,
-                "language": transcript.language,
-                "model_used": transcript.model_used,
-            }
-            segs = (
-                session.query(Segment)
-                .filter(Segment.transcript_id == transcript.id)
-                .order_by(Segment.start_time)
-                .all()
-            )
-            # Build speaker role map
-            speaker_labels = {s.speaker_label for s in segs if s.speaker_label}
-            role_map = {}
-            if speaker_labels:
-                speakers = session.query(Speaker).filter(Speaker.label.in_(speaker_labels)).all()
-                role_map = {sp.label: sp.role for sp in speakers}
-
-            segments = [
-                {
-                    "id": s.id,
-                    "speaker": s.speaker_label,
-                    "role": role_map.get(s.speaker_label),
-                    "text": s.text,
-                    "start_time": s.start_time,
-                    "end_time": s.end_time,
-                    "confidence": s.confidence,
-                }
-                for s in segs
-            ]
-
-        return {
+    # Returned directly so the (potentially large) payload skips
+    # jsonable_encoder and is encoded once by orjson
+    return ORJSONResponse(
+        {
             "recording": _recording_to_dict(recording),
             "transcript": transcript_dict,
             "segments": segments,
         }
-    finally:
-        session.close()
+    )
 
 
 @app.get("/api/recordings/{recording_id}/segments")
-def get_segments(recording_id: int):
+def get_segments(recording_id: int, session: Session = Depends(_get_db)):
     """Get segments with speaker labels and timestamps for a recording."""
-    init_db()
-    session = SessionLocal()
-    try:
-        recording = session.get(Recording, recording_id)
-        if not recording:
-            raise HTTPException(status_code=404, detail="Recording not found")
-
-        transcript = (
-            session.query(Transcript)
-            .filter(Transcript.recording_id == recording_id)
-            .first()
-        )
-        if not transcript:
-            return {"segments": []}
-
-        segs = (
-            session.query(Segment)
-            .filter(Segment.transcript_id == transcript.id)
-            .order_by(Segment.start_time)
-            .all()
-        )
+    recording = session.scalars(
+        _RECORDING_WITH_SEGMENTS.where(Recording.id == recording_id)
+    ).one_or_none()
+    if not recording:
+        raise HTTPException(status_code=404, detail="Recording not found")
 
-        speaker_labels = {s.speaker_label for s in segs if s.speaker_label}
-        role_map = {}
-        if speaker_labels:
-            speakers = session.query(Speaker).filter(Speaker.label.in_(speaker_labels)).all()
-            role_map = {sp.label: sp.role for sp in speakers}
-
-        return {
-            "segments": [
-                {
-                    "id": s.id,
-                    "speaker": s.speaker_label,
-                    "role": role_map.get(s.speaker_label),
-                    "text": s.text,
-                    "start_time": s.start_time,
-                    "end_time": s.end_time,
-                    "confidence": s.confidence,
-                }
-                for s in segs
-            ]
-        }
-    finally:
-        session.close()
+    if not recording.transcripts:
+        return {"segments": []}
+
+    roles = speaker_roles(session)
+    return {
+        "segments": [
+            _segment_to_dict(s, roles) for s in recording.transcripts[0].segments
+        ]
+    }
 
 
 @app.get("/api/recordings/{recording_id}/audio")
-def get_audio(recording_id: int):
+def get_audio(recording_id: int, session: Session = Depends(_get_db)):
     """Serve the WAV file for browser playback."""
-    init_db()
-    session = SessionLocal()
-    try:
-        recording = session.get(Recording, recording_id)
-        if not recording:
-            raise HTTPException(status_code=404, detail="Recording not found")
-        filepath = Path(recording.filepath)
-    finally:
-        session.close()
+    recording = session.scalars(_RECORDING.where(Recording.id == recording_id)).one_or_none()
+    if not recording:
+        raise HTTPException(status_code=404, detail="Recording not found")
+    filepath = Path(recording.filepath)
 
     if not filepath.exists():
         raise HTTPException(status_code=404, detail="Audio file not found on disk")
@@ -243,7 +294,10 @@ def get_audio(recording_id: int):
 
 
 @app.post("/api/recordings/upload")
-async def upload_recording(file: UploadFile = File(...)):
+async def upload_recording(
+    file: UploadFile = File(...),
+    session: Session = Depends(_get_db),
+):
     """Upload a new WAV file, save to WATCH_DIR and create a DB entry."""
     if not file.filename or not file.filename.lower().endswith(".wav"):
         raise HTTPException(status_code=400, detail="Only .wav files are supported")
@@ -261,58 +315,43 @@ async def upload_recording(file: UploadFile = File(...)):
             dest = watch_dir / f"{stem}_{counter}{suffix}"
             counter += 1
 
+    # Stream to disk in 1 MiB chunks; recordings can be hundreds of MB
     with open(dest, "wb") as f:
-        content = await file.read()
-        f.write(content)
+        while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+            f.write(chunk)
 
-    init_db()
-    session = SessionLocal()
-    try:
-        recording = Recording(
-            filename=dest.name,
-            filepath=str(dest),
-            status="pending",
-        )
-        session.add(recording)
-        session.commit()
-        result = _recording_to_dict(recording)
-    finally:
-        session.close()
+    recording = Recording(
+        filename=dest.name,
+        filepath=str(dest),
+        status="pending",
+    )
+    session.add(recording)
+    session.commit()
+    result = _recording_to_dict(recording)
 
     return {"recording": result, "message": "File uploaded successfully"}
 
 
 @app.post("/api/recordings/{recording_id}/reprocess")
-def reprocess_recording(recording_id: int):
+def reprocess_recording(recording_id: int, session: Session = Depends(_get_db)):
     """Re-run transcription on a recording in a background thread."""
-    init_db()
-    session = SessionLocal()
-    try:
-        recording = session.get(Recording, recording_id)
-        if not recording:
-            raise HTTPException(status_code=404, detail="Recording not found")
+    recording = session.get(Recording, recording_id)
+    if not recording:
+        raise HTTPException(status_code=404, detail="Recording not found")
 
-        filepath = recording.filepath
+    filepath = recording.filepath
 
-        # Delete old transcripts/segments
-        old_transcripts = (
-            session.query(Transcript)
-            .filter(Transcript.recording_id == recording_id)
-            .all()
-        )
-        for t in old_transcripts:
-            session.delete(t)
+    # Delete old transcripts; their segments go with them via ON DELETE CASCADE
+    session.execute(delete(Transcript).where(Transcript.recording_id == recording_id))
 
-        recording.status = "pending"
-        recording.error_message = None
-        recording.processed_at = None
-        session.commit()
-    finally:
-        session.close()
+    recording.status = "pending"
+    recording.error_message = None
+    recording.processed_at = None
+    session.commit()
+    forget_recording(filepath)
 
     # Process in background thread
     def _bg_process():
-        from transcriptor.watcher.folder_watcher import _process_file
         _process_file(Path(filepath))
 
     thread = threading.Thread(target=_bg_process, daemon=True)
@@ -322,20 +361,17 @@ def reprocess_recording(recording_id: int):
 
 
 @app.delete("/api/recordings/{recording_id}")
-def delete_recording(recording_id: int):
+def delete_recording(recording_id: int, session: Session = Depends(_get_db)):
     """Delete a recording and its transcripts."""
-    init_db()
-    session = SessionLocal()
-    try:
-        recording = session.get(Recording, recording_id)
-        if not recording:
-            raise HTTPException(status_code=404, detail="Recording not found")
+    recording = session.get(Recording, recording_id)
+    if not recording:
+        raise HTTPException(status_code=404, detail="Recording not found")
 
-        session.delete(recording)
-        session.commit()
-        return {"message": "Recording deleted", "recording_id": recording_id}
-    finally:
-        session.close()
+    filepath = recording.filepath
+    session.delete(recording)
+    session.commit()
+    forget_recording(filepath)
+    return {"message": "Recording deleted", "recording_id": recording_id}
 
 
 # ---------------------------------------------------------------------------
@@ -344,58 +380,80 @@ def delete_recording(recording_id: int):
 
 
 @app.get("/api/search")
-def search_transcripts(q: str = Query(..., min_length=1, description="Search text")):
+def search_transcripts(
+    q: str = Query(..., min_length=1, description="Search text"),
+    session: Session = Depends(_get_db),
+):
     """Full-text search across all transcripts, returning matching segments."""
-    init_db()
-    session = SessionLocal()
-    try:
-        pattern = f"%{q}%"
-
-        # Search in full transcript text
-        transcript_hits = (
-            session.query(Transcript, Recording)
-            .join(Recording, Transcript.recording_id == Recording.id)
-            .filter(Transcript.full_text.ilike(pattern))
-            .all()
+    if fts_enabled():
+        transcript_filter = Transcript.id.in_(
+            fts_match_ids(session, "transcripts", q, SEARCH_RESULT_LIMIT)
+        )
+        segment_filter = Segment.id.in_(
+            fts_match_ids(session, "segments", q, SEARCH_RESULT_LIMIT)
+        )
+    else:
+        # Lower-case the needle once; the column side matches the
+        # lower(...) expression indexes on SQLite.
+        pattern = f"%{q.lower()}%"
+        transcript_filter = func.lower(Transcript.full_text).like(pattern)
+        segment_filter = func.lower(Segment.text).like(pattern)
+
+    # Search in full transcript text; only a snippet around the match
+    # is returned, not the whole (possibly very long) transcript.
+    transcript_hits = session.execute(
+        select(
+            Recording.id,
+            Recording.filename,
+            search_snippet(Transcript.full_text, q).label("snippet"),
+        )
+        .join(Recording, Transcript.recording_id == Recording.id)
+        .where(transcript_filter)
+        .limit(SEARCH_RESULT_LIMIT)
+    ).all()
+
+    # Search in individual segments
+    segment_hits = session.execute(
+        select(
+            Recording.id,
+            Recording.filename,
+            Segment.speaker_label,
+            Segment.text,
+            Segment.start_time,
+            Segment.end_time,
+        )
+        .join(Transcript, Segment.transcript_id == Transcript.id)
+        .join(Recording, Transcript.recording_id == Recording.id)
+        .where(segment_filter)
+        .limit(SEARCH_RESULT_LIMIT)
+    ).all()
+
+    results = []
+
+    for recording_id, filename, snippet in transcript_hits:
+        results.append(
+            {
+                "recording_id": recording_id,
+                "filename": filename,
+                "match_type": "transcript",
+                "text": snippet,
+            }
         )
 
-        # Search in individual segments
-        segment_hits = (
-            session.query(Segment, Transcript, Recording)
-            .join(Transcript, Segment.transcript_id == Transcript.id)
-            .join(Recording, Transcript.recording_id == Recording.id)
-            .filter(Segment.text.ilike(pattern))
-            .all()
+    for recording_id, filename, speaker, text, start_time, end_time in segment_hits:
+        results.append(
+            {
+                "recording_id": recording_id,
+                "filename": filename,
+                "match_type": "segment",
+                "speaker": speaker,
+                "text": text,
+                "start_time": start_time,
+                "end_time": end_time,
+            }
         )
 
-        results = []
-
-        for transcript, recording in transcript_hits:
-            results.append(
-                {
-                    "recording_id": recording.id,
-                    "filename": recording.filename,
-                    "match_type": "transcript",
-                    "text": transcript.full_text,
-                }
-            )
-
-        for segment, transcript, recording in segment_hits:
-            results.append(
-                {
-                    "recording_id": recording.id,
-                    "filename": recording.filename,
-                    "match_type": "segment",
-                    "speaker": segment.speaker_label,
-                    "text": segment.text,
-                    "start_time": segment.start_time,
-                    "end_time": segment.end_time,
-                }
-            )
-
-        return {"results": results, "query": q, "total": len(results)}
-    finally:
-        session.close()
+    return ORJSONResponse({"results": results, "query": q, "total": len(results)})
 
 
 # ---------------------------------------------------------------------------
@@ -404,68 +462,48 @@ def search_transcripts(q: str = Query(..., min_length=1, description="Search tex
 
 
 @app.get("/api/stats")
-def get_stats():
-    """Dashboard statistics."""
-    init_db()
-    session = SessionLocal()
-    try:
-        total = session.query(func.count(Recording.id)).scalar() or 0
-        done = (
-            session.query(func.count(Recording.id))
-            .filter(Recording.status == "done")
-            .scalar() or 0
-        )
-        pending = (
-            session.query(func.count(Recording.id))
-            .filter(Recording.status == "pending")
-            .scalar() or 0
-        )
-        processing = (
-            session.query(func.count(Recording.id))
-            .filter(Recording.status == "processing")
-            .scalar() or 0
-        )
-        errors = (
-            session.query(func.count(Recording.id))
-            .filter(Recording.status == "error")
-            .scalar() or 0
-        )
-        avg_duration = (
-            session.query(func.avg(Recording.duration_seconds))
-            .filter(Recording.duration_seconds.isnot(None))
-            .scalar()
-        )
-        total_segments = session.query(func.count(Segment.id)).scalar() or 0
-
-        # Recordings per day (last 30 days)
-        recordings_by_day = (
-            session.query(
-                func.date(Recording.created_at).label("day"),
-                func.count(Recording.id).label("count"),
-            )
-            .group_by(func.date(Recording.created_at))
-            .order_by(func.date(Recording.created_at).desc())
-            .limit(30)
-            .all()
-        )
+def get_stats(session: Session = Depends(_get_db)):
+    """Dashboard statistics (cached briefly, since the dashboard polls this)."""
+    global _stats_cache
+
+    now = time.monotonic()
+    if _stats_cache is not None and now - _stats_cache[0] < _STATS_TTL_SECONDS:
+        return _stats_cache[1]
+
+    # Counts and duration totals for every status in one grouped query
+    status_rows = session.execute(_STATUS_TOTALS).all()
+    by_status = {status: count for status, count, _, _, _ in status_rows}
+    duration_sum = sum(dur_sum or 0.0 for _, _, dur_sum, _, _ in status_rows)
+    duration_count = sum(dur_count for _, _, _, dur_count, _ in status_rows)
+    avg_duration = duration_sum / duration_count if duration_count else None
+    total_segments = status_rows[0][4] if status_rows else 0
+
+    # Recordings per day (last 30 days) from the maintained daily counts
+    recordings_by_day = session.execute(
+        select(RecordingDaily.day, RecordingDaily.count)
+        .where(RecordingDaily.count > 0)
+        .order_by(RecordingDaily.day.desc())
+        .limit(30)
+    ).all()
+
+    result = {
+        "total_recordings": sum(by_status.values()),
+        "by_status": {
+            "done": by_status.get("done", 0),
+            "pending": by_status.get("pending", 0),
+            "processing": by_status.get("processing", 0),
+            "error": by_status.get("error", 0),
+        },
+        "avg_duration_seconds": round(avg_duration, 2) if avg_duration else None,
+        "total_segments": total_segments,
+        "recordings_per_day": [
+            {"date": str(row.day), "count": row.count}
+            for row in reversed(recordings_by_day)
+        ],
+    }
 
-        return {
-            "total_recordings": total,
-            "by_status": {
-                "done": done,
-                "pending": pending,
-                "processing": processing,
-                "error": errors,
-            },
-            "avg_duration_seconds": round(avg_duration, 2) if avg_duration else None,
-            "total_segments": total_segments,
-            "recordings_per_day": [
-                {"date": str(row.day), "count": row.count}
-                for row in reversed(list(recordings_by_day))
-            ],
-        }
-    finally:
-        session.close()
+    _stats_cache = (now, result)
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -484,40 +522,46 @@ def pipeline_status():
 @app.post("/api/pipeline/start")
 def pipeline_start():
     """Start the folder watcher in a background thread."""
-    global _watcher_thread, _watcher_observer, _watcher_stop_event
+    global _watcher_thread, _watcher_observer, _watcher_stop_event, _watcher_queue
 
     if _watcher_thread is not None and _watcher_thread.is_alive():
         return {"message": "Watcher is already running"}
 
-    import queue as queue_mod
-    from watchdog.observers import Observer
-    from transcriptor.watcher.folder_watcher import WavFileHandler, _process_file
-
     _watcher_stop_event.clear()
     watch_dir = Path(settings.WATCH_DIR)
     watch_dir.mkdir(parents=True, exist_ok=True)
 
-    processing_queue: queue_mod.Queue[Path] = queue_mod.Queue()
+    # None is the stop sentinel posted by pipeline_stop()
+    processing_queue: queue.SimpleQueue[Optional[Path]] = queue.SimpleQueue()
     handler = WavFileHandler(processing_queue)
     observer = Observer()
     observer.schedule(handler, str(watch_dir), recursive=False)
 
     def _run():
+        # Started first, so files arriving while the models load are queued
         observer.start()
         try:
-            while not _watcher_stop_event.is_set():
-                try:
-                    file_path = processing_queue.get(timeout=1)
-                    import time
-                    time.sleep(1)
-                    _process_file(file_path)
-                except queue_mod.Empty:
-                    continue
+            # Same pipeline (and loaded models) as reprocess requests; built
+            # here, off the request path: pulls in faster-whisper/pyannote
+            try:
+                pipeline = _shared_pipeline()
+                pipeline.warmup()
+            except Exception:
+                logger.exception("Could not load the transcription models")
+                raise
+            while True:
+                file_path = processing_queue.get()
+                # Files still queued when stop is requested are dropped
+                if file_path is None or _watcher_stop_event.is_set():
+                    break
+                handler.mark_started(file_path)
+                _process_file(file_path, pipeline)
         finally:
             observer.stop()
             observer.join()
 
     _watcher_observer = observer
+    _watcher_queue = processing_queue
     _watcher_thread = threading.Thread(target=_run, daemon=True, name="folder-watcher")
     _watcher_thread.start()
 
@@ -527,15 +571,17 @@ def pipeline_start():
 @app.post("/api/pipeline/stop")
 def pipeline_stop():
     """Stop the folder watcher."""
-    global _watcher_thread, _watcher_observer, _watcher_stop_event
+    global _watcher_thread, _watcher_observer, _watcher_stop_event, _watcher_queue
 
     if _watcher_thread is None or not _watcher_thread.is_alive():
         return {"message": "Watcher is not running"}
 
     _watcher_stop_event.set()
+    _watcher_queue.put(None)
     _watcher_thread.join(timeout=5)
     _watcher_thread = None
     _watcher_observer = None
+    _watcher_queue = None
 
     return {"message": "Watcher stopped"}
 
@@ -544,8 +590,6 @@ def pipeline_stop():
 # WebSocket for progress
 # ---------------------------------------------------------------------------
 
-from fastapi import WebSocket, WebSocketDisconnect
-
 
 @app.websocket("/ws/progress")
 async def websocket_progress(websocket: WebSocket):
@@ -562,15 +606,15 @@ async def websocket_progress(websocket: WebSocket):
 
 async def broadcast_progress(message: dict):
     """Broadcast a progress message to all connected WebSocket clients."""
-    import json
-    disconnected = []
-    for ws in _ws_clients:
-        try:
-            await ws.send_text(json.dumps(message))
-        except Exception:
-            disconnected.append(ws)
-    for ws in disconnected:
-        _ws_clients.remove(ws)
+    payload = orjson.dumps(message).decode()
+    clients = list(_ws_clients)
+    # Send concurrently so one slow client doesn't hold up the rest
+    results = await asyncio.gather(
+        *(ws.send_text(payload) for ws in clients), return_exceptions=True
+    )
+    for ws, result in zip(clients, results):
+        if isinstance(result, Exception) and ws in _ws_clients:
+            _ws_clients.remove(ws)
 
 
 # ---------------------------------------------------------------------------
@@ -583,10 +627,8 @@ _frontend_dir = Path(__file__).resolve().parent.parent.parent.parent / "frontend
 
 def mount_static(app_instance: FastAPI):
     """Mount frontend static assets and SPA fallback."""
-    from fastapi.staticfiles import StaticFiles
-    from fastapi.responses import HTMLResponse
-
-    if not _frontend_dir.exists():
+    index_html_path = _frontend_dir / "index.html"
+    if not index_html_path.exists():
         return
 
     # Serve /assets/* directly
@@ -594,17 +636,20 @@ def mount_static(app_instance: FastAPI):
     if assets_dir.exists():
         app_instance.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
 
-    # SPA catch-all: serve index.html for any non-API route
-    index_html = _frontend_dir / "index.html"
+    # SPA catch-all: serve index.html for any non-API route.  The shell page
+    # is read once here instead of from disk on every navigation.
+    index_html = index_html_path.read_bytes()
 
     @app_instance.get("/{path:path}", include_in_schema=False)
-    async def spa_fallback(path: str):
+    def spa_fallback(path: str):
+        # Sync def: Starlette runs it in the threadpool, keeping the
+        # filesystem checks below off the event loop.
         # Serve existing static files (e.g. vite.svg, favicon)
         static_file = _frontend_dir / path
-        if path and static_file.exists() and static_file.is_file():
+        if path and static_file.is_file():
             return FileResponse(str(static_file))
         # Otherwise serve index.html for client-side routing
-        return HTMLResponse(index_html.read_text())
+        return HTMLResponse(index_html)
 
 
 # Mount static after all API routes are registered
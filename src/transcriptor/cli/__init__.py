@@ -0,0 +1,5 @@
+"""Subcommands of the ``transcriptor`` CLI, one module per command family.
+
+Each module is imported only when :class:`transcriptor.main.LazyGroup`
+resolves one of its commands.
+"""
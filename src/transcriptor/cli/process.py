@@ -0,0 +1,32 @@
+"""``transcriptor process`` / ``process-all`` – one-shot transcription runs."""
+
+from pathlib import Path
+
+import click
+
+
+@click.command()
+@click.argument("file", type=click.Path(exists=True, path_type=Path))
+def process(file: Path):
+    """Process a single WAV file."""
+    if file.suffix.lower() != ".wav":
+        click.echo("Error: Only .wav files are supported.", err=True)
+        raise SystemExit(1)
+
+    from transcriptor.watcher.folder_watcher import process_single_file
+
+    click.echo(f"Processing: {file}")
+    process_single_file(file)
+    click.echo("Done.")
+
+
+@click.command("process-all")
+def process_all():
+    """Process all unprocessed WAV files in the NAGRANIA folder."""
+    from transcriptor.config import settings
+    from transcriptor.watcher.folder_watcher import process_all_unprocessed
+
+    watch_dir = Path(settings.WATCH_DIR)
+    click.echo(f"Processing all unprocessed WAV files in: {watch_dir}")
+    process_all_unprocessed(watch_dir)
+    click.echo("Done.")
@@ -0,0 +1,106 @@
+"""Read-only and labelling commands over stored transcripts."""
+
+import click
+
+
+@click.command()
+@click.argument("recording_id", type=int)
+def query(recording_id: int):
+    """Show transcript for a given recording ID."""
+    from transcriptor.api.query import get_transcript
+    from transcriptor.db.database import init_db
+
+    init_db()
+
+    result = get_transcript(recording_id)
+    if result is None:
+        click.echo(f"Recording #{recording_id} not found.", err=True)
+        raise SystemExit(1)
+
+    rec = result["recording"]
+    click.echo(f"Recording: {rec['filename']} (status: {rec['status']})")
+
+    if result["transcript"] is None:
+        click.echo("No transcript available yet.")
+        return
+
+    # Build the whole report and write it once instead of a flush per line
+    lines = [
+        f"Language: {result['transcript'].get('language', 'unknown')}",
+        f"\n{'='*60}",
+        "FULL TRANSCRIPT:",
+        f"{'='*60}",
+        result["transcript"]["full_text"],
+    ]
+
+    if result["segments"]:
+        lines += [f"\n{'='*60}", "SEGMENTS:", f"{'='*60}"]
+        for seg in result["segments"]:
+            role = seg["role"] or seg["speaker"] or "?"
+            start = seg["start_time"] or 0
+            end = seg["end_time"] or 0
+            lines.append(f"[{start:.1f}s - {end:.1f}s] {role}: {seg['text']}")
+    click.echo("\n".join(lines))
+
+
+@click.command()
+@click.argument("text")
+def search(text: str):
+    """Search across all transcripts."""
+    from transcriptor.api.query import search_transcripts
+    from transcriptor.db.database import init_db
+
+    init_db()
+
+    results = search_transcripts(text)
+    if not results:
+        click.echo("No results found.")
+        return
+
+    lines = [f"Found {len(results)} result(s):\n"]
+    for r in results:
+        lines.append(f"  Recording #{r['recording_id']} ({r['filename']}) [{r['match_type']}]")
+        if r["match_type"] == "segment":
+            role = r.get("role", r.get("speaker", "?"))
+            lines.append(f"    [{role}]: {r['text']}")
+        else:
+            text_preview = r["text"][:200] + "..." if len(r["text"]) > 200 else r["text"]
+            lines.append(f"    {text_preview}")
+        lines.append("")
+    click.echo("\n".join(lines))
+
+
+@click.command("swap-speakers")
+@click.argument("recording_id", type=int)
+def swap_speakers(recording_id: int):
+    """Swap agent/customer labels for a recording (manual override)."""
+    from transcriptor.api.query import swap_speakers as do_swap
+    from transcriptor.db.database import init_db
+
+    init_db()
+
+    if do_swap(recording_id):
+        click.echo(f"Swapped agent/customer labels for recording #{recording_id}.")
+    else:
+        click.echo(f"Recording #{recording_id} not found or has no transcript.", err=True)
+        raise SystemExit(1)
+
+
+@click.command("list")
+def list_recordings():
+    """List all recordings."""
+    from transcriptor.api.query import get_all_recordings
+    from transcriptor.db.database import init_db
+
+    init_db()
+
+    recordings = get_all_recordings()
+    if not recordings:
+        click.echo("No recordings found.")
+        return
+
+    lines = [f"{'ID':<6} {'Status':<10} {'Filename':<40} {'Duration':<10}", "-" * 66]
+    for r in recordings:
+        dur = f"{r['duration']:.1f}s" if r["duration"] else "-"
+        lines.append(f"{r['id']:<6} {r['status']:<10} {r['filename']:<40} {dur:<10}")
+    click.echo("\n".join(lines))
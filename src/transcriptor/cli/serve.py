@@ -0,0 +1,20 @@
+"""``transcriptor serve`` – run the dashboard web server."""
+
+import click
+
+
+@click.command()
+@click.option("--host", default="0.0.0.0", help="Host to bind to")
+@click.option("--port", default=8000, type=int, help="Port to listen on")
+@click.option("--reload", "do_reload", is_flag=True, help="Enable auto-reload for development")
+def serve(host: str, port: int, do_reload: bool):
+    """Start the dashboard web server (FastAPI + frontend)."""
+    import uvicorn
+
+    click.echo(f"Starting Transcriptor dashboard on http://{host}:{port}")
+    uvicorn.run(
+        "transcriptor.api.server:app",
+        host=host,
+        port=port,
+        reload=do_reload,
+    )
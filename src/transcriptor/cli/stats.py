@@ -0,0 +1,22 @@
+"""``transcriptor stats`` – overall transcription statistics."""
+
+import click
+
+
+@click.command()
+def stats():
+    """Show overall transcription statistics."""
+    from transcriptor.api.query import get_stats
+    from transcriptor.db.database import init_db
+
+    init_db()
+
+    s = get_stats()
+    click.echo("Transcriptor Statistics")
+    click.echo(f"{'='*30}")
+    click.echo(f"Total recordings:  {s['total_recordings']}")
+    click.echo(f"  Completed:       {s['done']}")
+    click.echo(f"  Pending:         {s['pending']}")
+    click.echo(f"  Errors:          {s['errors']}")
+    avg = s["avg_duration_seconds"]
+    click.echo(f"Avg duration:      {avg:.1f}s" if avg else "Avg duration:      N/A")
@@ -0,0 +1,16 @@
+"""``transcriptor watch`` – watch the recordings folder."""
+
+from pathlib import Path
+
+import click
+
+
+@click.command()
+def watch():
+    """Start watching the NAGRANIA folder for new WAV files."""
+    from transcriptor.config import settings
+    from transcriptor.watcher.folder_watcher import start_watcher
+
+    watch_dir = Path(settings.WATCH_DIR)
+    click.echo(f"Starting watcher on: {watch_dir}")
+    start_watcher(watch_dir)
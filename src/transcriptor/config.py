@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -14,15 +15,49 @@ class Settings:
 
     # Watched folder
     WATCH_DIR: str = os.getenv("WATCH_DIR", str(Path.home() / "Downloads" / "NAGRANIA"))
+    # Files the watcher processes at once (threads sharing one pipeline)
+    WATCHER_WORKERS: int = int(os.getenv("WATCHER_WORKERS", "2"))
+    # Seconds between sweeps for files whose events were dropped; 0 = off
+    WATCHER_RESCAN_SECONDS: float = float(os.getenv("WATCHER_RESCAN_SECONDS", "0"))
 
     # Whisper
     WHISPER_MODEL_SIZE: str = os.getenv("WHISPER_MODEL_SIZE", "large-v3")
     WHISPER_DEVICE: str = os.getenv("WHISPER_DEVICE", "auto")
-    WHISPER_COMPUTE_TYPE: str = os.getenv("WHISPER_COMPUTE_TYPE", "float16")
+    # auto = int8_float16 on CUDA, int8 on CPU
+    WHISPER_COMPUTE_TYPE: str = os.getenv("WHISPER_COMPUTE_TYPE", "auto")
     WHISPER_LANGUAGE: str = os.getenv("WHISPER_LANGUAGE", "pl")
+    # Concurrent transcribe() calls one model can serve (both stereo channels)
+    WHISPER_NUM_WORKERS: int = int(os.getenv("WHISPER_NUM_WORKERS", "2"))
+    # VAD chunks batched per forward pass (BatchedInferencePipeline); 0 = off.
+    # Opt-in: chunks are decoded independently, which changes segment
+    # boundaries and drops conditioning on the previous text.
+    WHISPER_BATCH_SIZE: int = int(os.getenv("WHISPER_BATCH_SIZE", "0"))
 
     # Pyannote
     PYANNOTE_AUTH_TOKEN: str = os.getenv("PYANNOTE_AUTH_TOKEN", "")
+    PYANNOTE_SEGMENTATION_STEP: float = float(os.getenv("PYANNOTE_SEGMENTATION_STEP", "2.0"))
+    # Empty = 0.65 with a step coarser than pyannote's 1.0 s, else the
+    # pretrained pipeline's threshold
+    PYANNOTE_CLUSTERING_THRESHOLD: Optional[float] = (
+        float(os.environ["PYANNOTE_CLUSTERING_THRESHOLD"])
+        if os.getenv("PYANNOTE_CLUSTERING_THRESHOLD")
+        else None
+    )
+    # Run speaker embeddings through an INT8 ONNX Runtime export (needs .[onnx])
+    PYANNOTE_ONNX_EMBEDDING: bool = os.getenv("PYANNOTE_ONNX_EMBEDDING", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+    # Exported models and other derived artefacts
+    CACHE_DIR: str = os.getenv("CACHE_DIR", str(Path.home() / ".cache" / "transcriptor"))
+    # Reuse diarization results for byte-identical audio (stored in CACHE_DIR)
+    DIARIZATION_CACHE: bool = os.getenv("DIARIZATION_CACHE", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
 
     # Processing
     MAX_CONCURRENT_JOBS: int = int(os.getenv("MAX_CONCURRENT_JOBS", "2"))
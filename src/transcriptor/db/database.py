@@ -1,16 +1,297 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import threading
+import time
+
+from sqlalchemy import (
+    case,
+    create_engine,
+    event,
+    func,
+    inspect,
+    make_url,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, object_session, scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 
 from transcriptor.config import settings
-from transcriptor.db.models import Base
+from transcriptor.db.models import Base, Recording, RecordingDaily, Speaker
+
+# Applied to every new SQLite connection: WAL lets dashboard readers proceed
+# while the watcher writes; NORMAL sync is durable enough under WAL.
+# foreign_keys is off by default in SQLite and needed for ON DELETE CASCADE.
+# cache_size is in KiB when negative: a 64 MiB page cache per connection.
+_SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _create_engine(database_url: str):
+    url = make_url(database_url)
+    kwargs: dict = {"pool_pre_ping": True}
+    if url.get_backend_name() == "sqlite":
+        # Pooled connections are handed between threadpool workers
+        kwargs["connect_args"] = {"check_same_thread": False}
+        if url.database in (None, "", ":memory:"):
+            # Every connection to :memory: is a new empty database
+            kwargs["poolclass"] = StaticPool
+        else:
+            kwargs.update(poolclass=QueuePool, pool_size=10, max_overflow=20)
+    else:
+        kwargs.update(pool_size=10, max_overflow=20)
+    return create_engine(url, echo=False, **kwargs)
+
+
+engine = _create_engine(settings.DATABASE_URL)
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+# Thread-local sessions: the watcher, reprocess threads and CLI each get
+# their own session from SessionLocal().  Objects stay usable after commit.
+SessionLocal = scoped_session(sessionmaker(bind=engine, expire_on_commit=False))
+
+# SQLite FTS5 indexes over segment/transcript text (external-content tables,
+# kept in sync by triggers).  Populated by init_db() when the SQLite build
+# ships FTS5; search falls back to ILIKE scans otherwise.
+FTS_TABLES = {"segments": "segment_fts", "transcripts": "transcript_fts"}
+
+_FTS_TOKENIZER = "unicode61 remove_diacritics 2"
+
+_FTS_COLUMNS = {"segments": "text", "transcripts": "full_text"}
+
+_fts_enabled = False
+
+# Search returns at most this many transcript hits and segment hits each;
+# transcript hits carry a short snippet around the match, not full_text.
+SEARCH_RESULT_LIMIT = 200
 
-engine = create_engine(settings.DATABASE_URL, echo=False)
-SessionLocal = sessionmaker(bind=engine)
+_SNIPPET_LEAD = 40
+
+_SNIPPET_LENGTH = 200
+
+# PostgreSQL trigram GIN indexes serving the lower(col) LIKE '%q%' search.
+TRGM_INDEXES = {
+    "ix_transcripts_full_text_trgm": ("transcripts", "full_text"),
+    "ix_segments_text_trgm": ("segments", "text"),
+}
+
+
+def _fts_ddl(content_table: str) -> list[str]:
+    fts = FTS_TABLES[content_table]
+    col = _FTS_COLUMNS[content_table]
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{col}, content='{content_table}', content_rowid='id', tokenize='{_FTS_TOKENIZER}')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {content_table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {col}) VALUES (new.id, new.{col}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {content_table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {col}) VALUES ('delete', old.id, old.{col}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {col} ON {content_table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {col}) VALUES ('delete', old.id, old.{col}); "
+        f"INSERT INTO {fts}(rowid, {col}) VALUES (new.id, new.{col}); END",
+    ]
+
+
+def _init_fts() -> bool:
+    """Create FTS5 tables + sync triggers; return False if FTS5 is unavailable."""
+    if engine.dialect.name != "sqlite":
+        return False
+    try:
+        with engine.begin() as conn:
+            existing = {
+                row[0]
+                for row in conn.execute(
+                    text("SELECT name FROM sqlite_master WHERE type = 'table'")
+                )
+            }
+            for content_table, fts in FTS_TABLES.items():
+                for stmt in _fts_ddl(content_table):
+                    conn.execute(text(stmt))
+                if fts not in existing:
+                    # Index rows written before the FTS table existed
+                    conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+    except OperationalError:
+        return False
+    return True
+
+
+def _init_trgm() -> None:
+    """Create pg_trgm GIN indexes so substring search can skip sequential scans."""
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for name, (table, col) in TRGM_INDEXES.items():
+            conn.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS {name} "
+                    f"ON {table} USING gin (lower({col}) gin_trgm_ops)"
+                )
+            )
+
+
+def _backfill_recordings_daily(conn) -> None:
+    day = func.date(Recording.created_at)
+    conn.execute(
+        RecordingDaily.__table__.insert().from_select(
+            ["day", "count"],
+            select(day, func.count(Recording.id))
+            .where(Recording.created_at.is_not(None))
+            .group_by(day),
+        )
+    )
+
+
+# init_db() is called by every entry point and may race with itself (API
+# startup, watcher workers); it does its schema checks once per process
+_init_db_lock = threading.Lock()
+_db_ready = False
 
 
 def init_db():
-    """Create all tables (for development; use Alembic migrations in production)."""
-    Base.metadata.create_all(bind=engine)
+    """Create all tables (for development; use Alembic migrations in production).
+
+    Only the first call in a process does any work.
+    """
+    global _fts_enabled, _db_ready
+    with _init_db_lock:
+        if _db_ready:
+            return
+        had_daily = inspect(engine).has_table(RecordingDaily.__tablename__)
+        Base.metadata.create_all(bind=engine)
+        if not had_daily:
+            # Count recordings that predate the per-day table
+            with engine.begin() as conn:
+                _backfill_recordings_daily(conn)
+        _fts_enabled = _init_fts()
+        _init_trgm()
+        _db_ready = True
+
+
+def fts_enabled() -> bool:
+    """Whether full-text search goes through the FTS5 index."""
+    return _fts_enabled
+
+
+def fts_match_ids(
+    session, content_table: str, query: str, limit: int | None = None
+) -> list[int]:
+    """Return ids of *content_table* rows whose text matches *query* via FTS5.
+
+    *query* is treated as a literal phrase (prefix-matched on its last token),
+    not as FTS5 query syntax.
+    """
+    fts = FTS_TABLES[content_table]
+    phrase = '"' + query.replace('"', '""') + '" *'
+    sql = f"SELECT rowid FROM {fts} WHERE {fts} MATCH :q"
+    params = {"q": phrase}
+    if limit is not None:
+        sql += " LIMIT :limit"
+        params["limit"] = limit
+    rows = session.execute(text(sql), params)
+    return [row[0] for row in rows]
+
+
+def search_snippet(column, query: str):
+    """SQL expression for a short window of *column* starting just before *query*.
+
+    Falls back to the start of the text when the needle is not found
+    literally (e.g. FTS matched it with diacritics folded).
+    """
+    locate = func.strpos if engine.dialect.name == "postgresql" else func.instr
+    pos = locate(func.lower(column), query.lower())
+    start = case((pos > _SNIPPET_LEAD, pos - _SNIPPET_LEAD), else_=1)
+    return func.substr(column, start, _SNIPPET_LENGTH)
+
+
+# {label: role} for all speakers.  Speakers change rarely, so readers share
+# one snapshot; committed ORM writes to Speaker drop it and the TTL bounds
+# staleness from other processes or bulk statements.
+_SPEAKER_ROLES_TTL_SECONDS = 30.0
+
+_speaker_roles_cache: tuple[float, dict[str, str | None]] | None = None
+
+
+def speaker_roles(session) -> dict[str, str | None]:
+    """Return the cached ``{speaker label: role}`` map, reloading it when stale."""
+    global _speaker_roles_cache
+    cached = _speaker_roles_cache
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _SPEAKER_ROLES_TTL_SECONDS:
+        return cached[1]
+    roles = dict(session.execute(select(Speaker.label, Speaker.role)).all())
+    _speaker_roles_cache = (now, roles)
+    return roles
+
+
+def _mark_speakers_changed(mapper, connection, target):
+    object_session(target).info["speakers_changed"] = True
+
+
+for _event in ("after_insert", "after_update", "after_delete"):
+    event.listen(Speaker, _event, _mark_speakers_changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_speaker_roles(session):
+    # Wait for the commit so no reader caches the uncommitted rows
+    global _speaker_roles_cache
+    if session.info.pop("speakers_changed", False):
+        _speaker_roles_cache = None
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_speaker_changes(session):
+    session.info.pop("speakers_changed", None)
+
+
+def _bump_recordings_daily(connection, created_at, delta: int) -> None:
+    """Add *delta* to the recordings_daily bucket for *created_at*'s day."""
+    if created_at is None:
+        return
+    table = RecordingDaily.__table__
+    day = created_at.date()
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = insert(table).values(day=day, count=delta)
+        connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.day],
+                set_={"count": table.c.count + delta},
+            )
+        )
+        return
+    result = connection.execute(
+        update(table).where(table.c.day == day).values(count=table.c.count + delta)
+    )
+    if result.rowcount == 0:
+        connection.execute(table.insert().values(day=day, count=delta))
+
+
+@event.listens_for(Recording, "after_insert")
+def _count_recording_insert(mapper, connection, target):
+    _bump_recordings_daily(connection, target.created_at, 1)
+
+
+@event.listens_for(Recording, "after_delete")
+def _count_recording_delete(mapper, connection, target):
+    _bump_recordings_daily(connection, target.created_at, -1)
 
 
 def get_session():
@@ -1,16 +1,17 @@
-from datetime import datetime
-
 from sqlalchemy import (
     Column,
+    Date,
     DateTime,
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    func,
 )
-from sqlalchemy.orm import DeclarativeBase, relationship
+from sqlalchemy.orm import DeclarativeBase, foreign, relationship
 
 
 class Base(DeclarativeBase):
@@ -19,12 +20,24 @@ class Base(DeclarativeBase):
 
 class Recording(Base):
     __tablename__ = "recordings"
+    __table_args__ = (
+        # Leading status column serves status filters; filename makes
+        # process-all's "done filenames" lookup index-only.
+        Index("ix_recordings_status_filename", "status", "filename"),
+        Index("ix_recordings_created_at", "created_at"),
+        Index("ix_recordings_content_hash", "content_hash"),
+    )
+    # Fetch server-generated created_at right after INSERT (via RETURNING)
+    # so it is loaded for the recordings_daily listener and API responses.
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True)
     filename = Column(String(255), nullable=False)
     filepath = Column(String(1024), nullable=False, unique=True)
+    # BLAKE2b of the audio bytes; finds copies of an already-transcribed file
+    content_hash = Column(String(64), nullable=True)
     duration_seconds = Column(Float, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
     processed_at = Column(DateTime, nullable=True)
     status = Column(
         Enum("pending", "processing", "done", "error", name="recording_status"),
@@ -33,7 +46,13 @@ class Recording(Base):
     )
     error_message = Column(Text, nullable=True)
 
-    transcripts = relationship("Transcript", back_populates="recording", cascade="all, delete-orphan")
+    transcripts = relationship(
+        "Transcript",
+        back_populates="recording",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="Transcript.id",
+    )
 
     def __repr__(self):
         return f"<Recording(id={self.id}, filename='{self.filename}', status='{self.status}')>"
@@ -41,15 +60,24 @@ class Recording(Base):
 
 class Transcript(Base):
     __tablename__ = "transcripts"
+    __table_args__ = (Index("ix_transcripts_recording_id", "recording_id"),)
 
     id = Column(Integer, primary_key=True)
-    recording_id = Column(Integer, ForeignKey("recordings.id"), nullable=False)
+    recording_id = Column(Integer, ForeignKey("recordings.id", ondelete="CASCADE"), nullable=False)
     full_text = Column(Text, nullable=True)
     language = Column(String(10), nullable=True)
     model_used = Column(String(100), nullable=True)
 
     recording = relationship("Recording", back_populates="transcripts")
-    segments = relationship("Segment", back_populates="transcript", cascade="all, delete-orphan")
+    segments = relationship(
+        "Segment",
+        back_populates="transcript",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="Segment.start_time",
+        # A transcript is almost never read without its segments
+        lazy="selectin",
+    )
 
     def __repr__(self):
         return f"<Transcript(id={self.id}, recording_id={self.recording_id}, language='{self.language}')>"
@@ -57,9 +85,10 @@ class Transcript(Base):
 
 class Segment(Base):
     __tablename__ = "segments"
+    __table_args__ = (Index("ix_segments_transcript_id_start", "transcript_id", "start_time"),)
 
     id = Column(Integer, primary_key=True)
-    transcript_id = Column(Integer, ForeignKey("transcripts.id"), nullable=False)
+    transcript_id = Column(Integer, ForeignKey("transcripts.id", ondelete="CASCADE"), nullable=False)
     speaker_label = Column(String(50), nullable=True)
     text = Column(Text, nullable=False)
     start_time = Column(Float, nullable=False)
@@ -67,13 +96,34 @@ class Segment(Base):
     confidence = Column(Float, nullable=True)
 
     transcript = relationship("Transcript", back_populates="segments")
+    speaker = relationship(
+        "Speaker",
+        primaryjoin=lambda: foreign(Segment.speaker_label) == Speaker.label,
+        viewonly=True,
+    )
 
     def __repr__(self):
         return f"<Segment(id={self.id}, speaker='{self.speaker_label}', start={self.start_time:.1f})>"
 
 
+# Expression indexes backing the lower(col) LIKE search fallback.  SQLite
+# only: PostgreSQL btree entries are size-capped, which long transcripts exceed.
+Index("ix_transcripts_full_text_lower", func.lower(Transcript.full_text)).ddl_if(dialect="sqlite")
+Index("ix_segments_text_lower", func.lower(Segment.text)).ddl_if(dialect="sqlite")
+
+
 class Speaker(Base):
     __tablename__ = "speakers"
+    __table_args__ = (
+        Index("ix_speakers_role", "role"),
+        # label is already unique-indexed; PostgreSQL additionally needs
+        # text_pattern_ops for LIKE 'prefix%' lookups under non-C locales.
+        Index(
+            "ix_speakers_label_pattern",
+            "label",
+            postgresql_ops={"label": "text_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True)
     label = Column(String(100), nullable=False, unique=True)
@@ -85,3 +135,19 @@ class Speaker(Base):
 
     def __repr__(self):
         return f"<Speaker(id={self.id}, label='{self.label}', role='{self.role}')>"
+
+
+class RecordingDaily(Base):
+    """Number of recordings created per day, maintained on insert/delete.
+
+    Lets the dashboard read the per-day chart without grouping the whole
+    recordings table; see ``transcriptor.db.database``.
+    """
+
+    __tablename__ = "recordings_daily"
+
+    day = Column(Date, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<RecordingDaily(day={self.day}, count={self.count})>"
@@ -0,0 +1,105 @@
+"""Content-addressed cache of diarization results.
+
+Recordings are often re-run after an error or a reprocess request; their
+audio has not changed, so the diarization (the most expensive stage) can be
+read back from disk.  Entries are keyed by a BLAKE2 digest of the audio bytes
+and the diarizer settings that affect its output, and stored as JSON under
+``CACHE_DIR/diarization``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from transcriptor.config import settings
+from transcriptor.diarizer.pyannote_service import (
+    DiarizationResult,
+    DiarizationSegment,
+    PyannoteDiarizer,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored layout or the diarization post-processing changes
+CACHE_VERSION = 1
+
+
+def _cache_dir() -> Path:
+    return Path(settings.CACHE_DIR).expanduser() / "diarization"
+
+
+def _cache_key(audio_path: Path, diarizer: PyannoteDiarizer, num_speakers: int) -> str:
+    digest = hashlib.blake2b(digest_size=32)
+    # hashlib.file_digest() would need Python 3.11
+    with audio_path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    digest.update(f"|v{CACHE_VERSION}|{diarizer.fingerprint}|{num_speakers}".encode())
+    return digest.hexdigest()
+
+
+def _load(path: Path) -> Optional[DiarizationResult]:
+    try:
+        data = json.loads(path.read_text())
+        segments = [
+            DiarizationSegment(speaker, start, end)
+            for speaker, start, end in data["segments"]
+        ]
+        return DiarizationResult(segments=segments, num_speakers=data["num_speakers"])
+    except FileNotFoundError:
+        return None
+    except (ValueError, KeyError, TypeError):
+        logger.warning("Ignoring unreadable diarization cache entry %s", path.name)
+        return None
+
+
+def _store(path: Path, result: DiarizationResult) -> None:
+    data = {
+        "num_speakers": result.num_speakers,
+        "segments": [[s.speaker, s.start, s.end] for s in result.segments],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write-then-rename so a concurrent reader never sees a partial file; the
+    # temp name is unique per call, as watcher threads may store the same key
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, suffix=".tmp", delete=False
+    ) as tmp:
+        tmp.write(json.dumps(data))
+    try:
+        os.replace(tmp.name, path)
+    except OSError:
+        os.unlink(tmp.name)
+        raise
+
+
+def diarize_cached(
+    audio_path: str | Path,
+    diarizer: PyannoteDiarizer,
+    *,
+    num_speakers: Optional[int] = None,
+    audio: Optional[dict] = None,
+) -> DiarizationResult:
+    """:meth:`PyannoteDiarizer.diarize`, reusing a stored result for identical audio."""
+    audio_path = Path(audio_path)
+    if not settings.DIARIZATION_CACHE or not audio_path.exists():
+        return diarizer.diarize(audio_path, num_speakers=num_speakers, audio=audio)
+
+    n_speakers = num_speakers or diarizer.num_speakers
+    path = _cache_dir() / f"{_cache_key(audio_path, diarizer, n_speakers)}.json"
+    result = _load(path)
+    if result is not None:
+        logger.info("Diarization cache hit for %s", audio_path.name)
+        return result
+
+    result = diarizer.diarize(audio_path, num_speakers=n_speakers, audio=audio)
+    try:
+        _store(path, result)
+    except OSError:
+        logger.warning("Could not write diarization cache entry %s", path, exc_info=True)
+    return result
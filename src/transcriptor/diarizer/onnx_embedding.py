@@ -0,0 +1,143 @@
+"""INT8 ONNX Runtime backend for the pyannote speaker-embedding model.
+
+Speaker-embedding extraction is the most compute-heavy stage of the
+diarization pipeline.  :func:`use_onnx_embedding` exports the embedding
+network of a loaded pipeline to ONNX once, quantizes its weights to INT8,
+caches the result under :pydata:`transcriptor.config.settings.CACHE_DIR` and
+swaps it in for the torch module.  Filterbank features and clustering still
+run in pyannote.
+
+Requires the optional ``onnx`` and ``onnxruntime`` packages
+(``pip install -e ".[onnx]"``).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from pathlib import Path
+
+import torch
+
+from transcriptor.config import settings
+
+logger = logging.getLogger(__name__)
+
+ONNX_OPSET = 17
+
+# Dummy 10 s chunk at 16 kHz and its segmentation-frame weights, used only to
+# trace the export; time and frame axes are dynamic.
+_TRACE_SAMPLES = 160000
+_TRACE_FRAMES = 589
+
+
+class _EmbeddingHead(torch.nn.Module):
+    """WeSpeaker ResNet from filterbank features + frame weights to embeddings."""
+
+    def __init__(self, resnet: torch.nn.Module) -> None:
+        super().__init__()
+        self.resnet = resnet
+
+    def forward(self, fbank: torch.Tensor, weights: torch.Tensor) -> torch.Tensor:
+        return self.resnet(fbank, weights=weights)[1]
+
+
+class _OnnxResNet(torch.nn.Module):
+    """Drop-in for the WeSpeaker ResNet submodule, backed by ONNX Runtime."""
+
+    def __init__(self, session, fallback: torch.nn.Module) -> None:
+        super().__init__()
+        self._session = session
+        # Calls without frame weights never reach the exported graph
+        self.fallback = fallback
+
+    def forward(self, fbank: torch.Tensor, weights: torch.Tensor | None = None):
+        if weights is None:
+            return self.fallback(fbank, weights=weights)
+        (embeddings,) = self._session.run(
+            None,
+            {
+                "fbank": fbank.detach().float().cpu().numpy(),
+                "weights": weights.detach().float().cpu().numpy(),
+            },
+        )
+        # Same (unused, embedding) pair as the ResNet it replaces
+        return None, torch.from_numpy(embeddings).to(fbank.device)
+
+
+def _cache_path(model_name: str) -> Path:
+    slug = re.sub(r"\W+", "_", model_name).strip("_") or "embedding"
+    return Path(settings.CACHE_DIR).expanduser() / f"{slug}_int8.onnx"
+
+
+def _export_int8(model: torch.nn.Module, path: Path) -> None:
+    """Export *model*'s ResNet to ONNX and write an INT8-weight copy to *path*."""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fp32_path = path.with_name(path.stem + "_fp32.onnx")
+    device = model.device
+
+    with torch.no_grad():
+        fbank = model.compute_fbank(torch.zeros(1, 1, _TRACE_SAMPLES, device=device))
+    weights = torch.ones(1, _TRACE_FRAMES)
+
+    # Tracing runs on the CPU; _EmbeddingHead shares (and so moves) the ResNet
+    head = _EmbeddingHead(model.resnet).cpu().eval()
+    try:
+        torch.onnx.export(
+            head,
+            (fbank.cpu(), weights),
+            str(fp32_path),
+            input_names=["fbank", "weights"],
+            output_names=["embeddings"],
+            dynamic_axes={
+                "fbank": {0: "batch", 1: "time"},
+                "weights": {0: "batch", 1: "frames"},
+                "embeddings": {0: "batch"},
+            },
+            opset_version=ONNX_OPSET,
+        )
+        quantize_dynamic(str(fp32_path), str(path), weight_type=QuantType.QInt8)
+    finally:
+        model.resnet.to(device)
+        fp32_path.unlink(missing_ok=True)
+
+
+def use_onnx_embedding(pipeline) -> bool:  # noqa: ANN001
+    """Run *pipeline*'s speaker-embedding network through INT8 ONNX Runtime.
+
+    Returns False (leaving the torch model in place) when the dependencies
+    are missing or the embedding model is not a WeSpeaker ResNet.
+    """
+    try:
+        import onnxruntime as ort
+    except ImportError:
+        logger.warning(
+            "onnxruntime is not installed; keeping the torch embedding model. "
+            'Install it with: pip install -e ".[onnx]"'
+        )
+        return False
+
+    model = getattr(pipeline._embedding, "model_", None)
+    if model is None or not hasattr(model, "resnet") or not hasattr(model, "compute_fbank"):
+        logger.warning("Embedding model is not a WeSpeaker ResNet; keeping torch.")
+        return False
+
+    path = _cache_path(str(getattr(pipeline, "embedding", "embedding")))
+    if not path.exists():
+        logger.info("Exporting speaker-embedding model to %s …", path)
+        try:
+            _export_int8(model, path)
+        except Exception:
+            logger.exception("ONNX export of the embedding model failed; keeping torch.")
+            return False
+
+    available = ort.get_available_providers()
+    providers = [
+        p for p in ("CUDAExecutionProvider", "CPUExecutionProvider") if p in available
+    ]
+    session = ort.InferenceSession(str(path), providers=providers)
+    model.resnet = _OnnxResNet(session, fallback=model.resnet)
+    logger.info("Speaker embeddings run on ONNX Runtime (%s).", ", ".join(providers))
+    return True
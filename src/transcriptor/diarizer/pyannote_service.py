@@ -8,21 +8,51 @@ by default via :pydata:`transcriptor.config.settings`.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from transcriptor.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Loaded pipelines keyed by (model name, auth token, segmentation step,
+# clustering threshold, ONNX embedding).  Loading takes several seconds, so
+# every PyannoteDiarizer with the same settings shares one instance.
+_PIPELINE_CACHE: Dict[Tuple[str, str, float, Optional[float], bool], Any] = {}
+_PIPELINE_CACHE_LOCK = threading.Lock()
+# One per cached pipeline: pyannote keeps per-call inference state on the
+# pipeline and its models, so concurrent callers (watcher threads) take turns
+_INFERENCE_LOCKS: Dict[Tuple[str, str, float, Optional[float], bool], threading.Lock] = {}
+
+# ``pyannote.audio.Pipeline``, resolved on first use by _pipeline_cls()
+_PipelineCls = None
+
+
+def _pipeline_cls():  # noqa: ANN202
+    """Import ``pyannote.audio.Pipeline`` once and keep it at module scope."""
+    global _PipelineCls
+    if _PipelineCls is None:
+        try:
+            from pyannote.audio import Pipeline  # type: ignore[import-untyped]
+        except ImportError as exc:
+            raise ImportError(
+                "pyannote.audio is required for diarization. "
+                "Install it with: pip install pyannote.audio"
+            ) from exc
+        _PipelineCls = Pipeline
+    return _PipelineCls
+
 
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class DiarizationSegment:
     """One contiguous region attributed to a single speaker."""
 
@@ -31,10 +61,26 @@ class DiarizationSegment:
     end: float
 
 
-@dataclass
+@dataclass(slots=True)
 class DiarizationResult:
     segments: List[DiarizationSegment]
     num_speakers: int
+    # Struct-of-arrays view of ``segments`` (same order) for vectorised
+    # alignment; ``speaker_ids`` index into ``labels``.
+    starts: np.ndarray = field(init=False, repr=False)
+    ends: np.ndarray = field(init=False, repr=False)
+    speaker_ids: np.ndarray = field(init=False, repr=False)
+    labels: List[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        n = len(self.segments)
+        self.labels = list(dict.fromkeys(s.speaker for s in self.segments))
+        label_ids = {label: i for i, label in enumerate(self.labels)}
+        self.starts = np.fromiter((s.start for s in self.segments), np.float64, n)
+        self.ends = np.fromiter((s.end for s in self.segments), np.float64, n)
+        self.speaker_ids = np.fromiter(
+            (label_ids[s.speaker] for s in self.segments), np.int32, n
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -46,47 +92,157 @@ class PyannoteDiarizer:
     """Lazy wrapper around ``pyannote.audio`` speaker-diarization pipeline."""
 
     DEFAULT_NUM_SPEAKERS = 2
+    MODEL_NAME = "pyannote/speaker-diarization-3.1"
+    SAMPLE_RATE = 16000
+    # The pretrained pipeline's step: 10% of its 10 s segmentation window
+    STOCK_SEGMENTATION_STEP = 1.0
+    # Clustering threshold used with a coarser step when none is configured
+    COARSE_STEP_CLUSTERING_THRESHOLD = 0.65
 
     def __init__(
         self,
         auth_token: Optional[str] = None,
         num_speakers: Optional[int] = None,
+        fp16: bool = True,
+        segmentation_step: Optional[float] = None,
+        clustering_threshold: Optional[float] = None,
+        onnx_embedding: Optional[bool] = None,
     ) -> None:
         self._auth_token = auth_token or settings.PYANNOTE_AUTH_TOKEN
         self._num_speakers = num_speakers or self.DEFAULT_NUM_SPEAKERS
+        # Sliding-window step of the segmentation model, in seconds.  A
+        # coarser step cuts segmentation compute roughly proportionally;
+        # pair it with a slightly lower clustering threshold to avoid
+        # undercounting speakers.
+        self._segmentation_step = segmentation_step or settings.PYANNOTE_SEGMENTATION_STEP
+        if clustering_threshold is None:
+            clustering_threshold = settings.PYANNOTE_CLUSTERING_THRESHOLD
+        if clustering_threshold is None and self._segmentation_step > self.STOCK_SEGMENTATION_STEP:
+            clustering_threshold = self.COARSE_STEP_CLUSTERING_THRESHOLD
+        self._clustering_threshold = clustering_threshold
+        # Mixed-precision inference on CUDA; disable for accuracy-critical runs
+        self._fp16 = fp16
+        if onnx_embedding is None:
+            onnx_embedding = settings.PYANNOTE_ONNX_EMBEDDING
+        self._onnx_embedding = onnx_embedding
         self._pipeline = None  # type: ignore[assignment]
+        self._inference_lock: Optional[threading.Lock] = None
+        self._device = None
 
     # -- lazy init ----------------------------------------------------------
 
     def _get_pipeline(self):  # noqa: ANN202
-        """Load the pyannote pipeline on first use."""
+        """Load the pyannote pipeline on first use (shared process-wide)."""
         if self._pipeline is None:
-            logger.info("Loading pyannote speaker-diarization pipeline …")
-            try:
-                from pyannote.audio import Pipeline  # type: ignore[import-untyped]
-            except ImportError as exc:
-                raise ImportError(
-                    "pyannote.audio is required for diarization. "
-                    "Install it with: pip install pyannote.audio"
-                ) from exc
-
-            kwargs = {}
-            if self._auth_token:
-                kwargs["token"] = self._auth_token
-            self._pipeline = Pipeline.from_pretrained(
-                "pyannote/speaker-diarization-3.1",
-                **kwargs,
+            key = (
+                self.MODEL_NAME,
+                self._auth_token,
+                self._segmentation_step,
+                self._clustering_threshold,
+                self._onnx_embedding,
             )
-            logger.info("Pyannote pipeline loaded successfully.")
+            with _PIPELINE_CACHE_LOCK:
+                if key not in _PIPELINE_CACHE:
+                    _PIPELINE_CACHE[key] = self._load_pipeline()
+                    _INFERENCE_LOCKS[key] = threading.Lock()
+                self._pipeline = _PIPELINE_CACHE[key]
+                self._inference_lock = _INFERENCE_LOCKS[key]
+            self._device = self._pipeline.device
         return self._pipeline
 
+    def _load_pipeline(self):  # noqa: ANN202
+        logger.info("Loading pyannote speaker-diarization pipeline …")
+        Pipeline = _pipeline_cls()
+
+        kwargs = {}
+        if self._auth_token:
+            kwargs["token"] = self._auth_token
+        pipeline = Pipeline.from_pretrained(self.MODEL_NAME, **kwargs)
+
+        # The segmentation Inference is built with its step at load time, so
+        # patch it there; segmentation_step itself is a fraction of the window.
+        segmentation = pipeline._segmentation
+        segmentation.step = self._segmentation_step
+        pipeline.segmentation_step = self._segmentation_step / segmentation.duration
+        if self._clustering_threshold is not None:
+            pipeline.clustering.threshold = self._clustering_threshold
+
+        import torch
+
+        # pyannote loads onto the CPU; it never picks the GPU by itself
+        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        pipeline.to(device)
+        if device.type == "cuda":
+            # Let remaining FP32 matmuls/convolutions use Tensor Cores
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+        if self._onnx_embedding:
+            from transcriptor.diarizer.onnx_embedding import use_onnx_embedding
+
+            use_onnx_embedding(pipeline)
+        logger.info(
+            "Pyannote pipeline loaded successfully (device=%s, step=%.2fs, threshold=%s).",
+            device,
+            self._segmentation_step,
+            self._clustering_threshold if self._clustering_threshold is not None else "default",
+        )
+        return pipeline
+
+    def _to_device(self, audio: dict) -> dict:
+        """Move a decoded waveform to the pipeline device and resample to 16 kHz."""
+        import torchaudio
+
+        waveform = audio["waveform"].to(self._device, non_blocking=True)
+        sample_rate = audio["sample_rate"]
+        if sample_rate != self.SAMPLE_RATE:
+            waveform = torchaudio.functional.resample(
+                waveform, sample_rate, self.SAMPLE_RATE
+            )
+        return {"waveform": waveform, "sample_rate": self.SAMPLE_RATE}
+
     # -- public API ---------------------------------------------------------
 
+    def warmup(self) -> None:
+        """Load the pipeline now rather than on the first :meth:`diarize`."""
+        self._get_pipeline()
+
+    @property
+    def num_speakers(self) -> int:
+        """Expected number of speakers used when :meth:`diarize` gets none."""
+        return self._num_speakers
+
+    @property
+    def fingerprint(self) -> str:
+        """The settings that determine this diarizer's output, as one string."""
+        return (
+            f"{self.MODEL_NAME}|step={self._segmentation_step}"
+            f"|threshold={self._clustering_threshold}|onnx={self._onnx_embedding}"
+        )
+
+    def load_waveform(self, audio_path: str | Path) -> dict:
+        """Decode *audio_path* into a mono CPU waveform for :meth:`diarize`.
+
+        Safe to call from a worker thread, e.g. to decode the next file while
+        the current one is being diarized.  Passing a path to pyannote instead
+        makes it re-read and decode the file for every sliding window.
+        """
+        import torch
+        import torchaudio
+
+        waveform, sample_rate = torchaudio.load(str(audio_path))
+        if waveform.shape[0] > 1:
+            waveform = waveform.mean(dim=0, keepdim=True)
+        if torch.cuda.is_available():
+            # Pinned memory makes the later host-to-device copy asynchronous
+            waveform = waveform.pin_memory()
+        return {"waveform": waveform, "sample_rate": sample_rate}
+
     def diarize(
         self,
         audio_path: str | Path,
         *,
         num_speakers: Optional[int] = None,
+        audio: Optional[dict] = None,
     ) -> DiarizationResult:
         """Run speaker diarization on *audio_path*.
 
@@ -96,6 +252,9 @@ class PyannoteDiarizer:
             Path to a WAV file.
         num_speakers:
             Override the default expected number of speakers.
+        audio:
+            The file already decoded by :meth:`load_waveform`; decoded here
+            if omitted.
 
         Returns
         -------
@@ -113,16 +272,34 @@ class PyannoteDiarizer:
             "Diarizing %s (num_speakers=%d)", audio_path.name, n_speakers
         )
 
-        diarize_output = pipeline(
-            str(audio_path),
-            num_speakers=n_speakers,
-        )
+        import torch
+
+        if audio is None:
+            audio = self.load_waveform(audio_path)
+        audio = self._to_device(audio)
+        use_fp16 = self._fp16 and self._device.type == "cuda"
+        # Serialised across threads; Whisper still runs concurrently
+        with self._inference_lock, torch.inference_mode(), torch.autocast(
+            device_type=self._device.type, dtype=torch.float16, enabled=use_fp16
+        ):
+            diarize_output = pipeline(audio, num_speakers=n_speakers)
 
         # pyannote >=3.1 returns DiarizeOutput dataclass; extract the Annotation
         annotation = getattr(diarize_output, "speaker_diarization", diarize_output)
 
+        tracks = list(annotation.itertracks(yield_label=True))
+        starts = np.fromiter((turn.start for turn, _, _ in tracks), np.float64, len(tracks))
+
+        # pyannote yields turns in time order; only sort if that ever changes
+        if np.all(starts[1:] >= starts[:-1]):
+            order = range(len(tracks))
+        else:
+            order = np.argsort(starts, kind="stable")
         segments: List[DiarizationSegment] = []
-        for turn, _, speaker in annotation.itertracks(yield_label=True):
+        seen: set[str] = set()
+        seen_add = seen.add
+        for i in order:
+            turn, _, speaker = tracks[i]
             segments.append(
                 DiarizationSegment(
                     speaker=speaker,
@@ -130,18 +307,15 @@ class PyannoteDiarizer:
                     end=turn.end,
                 )
             )
+            seen_add(speaker)
 
-        # Sort by start time (should already be, but be safe)
-        segments.sort(key=lambda s: s.start)
-
-        unique_speakers = {s.speaker for s in segments}
         logger.info(
             "Diarization complete: %d segments, %d unique speakers",
             len(segments),
-            len(unique_speakers),
+            len(seen),
         )
 
         return DiarizationResult(
             segments=segments,
-            num_speakers=len(unique_speakers),
+            num_speakers=len(seen),
         )
@@ -17,13 +17,16 @@ from __future__ import annotations
 
 import logging
 import re
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Literal, Optional
 
+import numpy as np
+import soundfile as sf
 from pydub import AudioSegment  # type: ignore[import-untyped]
 
+from transcriptor.diarizer.cache import diarize_cached
 from transcriptor.diarizer.pyannote_service import (
     DiarizationResult,
     DiarizationSegment,
@@ -32,6 +35,7 @@ from transcriptor.diarizer.pyannote_service import (
 from transcriptor.transcriber.whisper_service import (
     TranscriptionResult,
     TranscriptionSegment,
+    TranscriptionStream,
     WhisperService,
 )
 
@@ -75,37 +79,84 @@ class PipelineResult:
 # ---------------------------------------------------------------------------
 
 
-def _load_audio(path: Path) -> AudioSegment:
-    """Load an audio file via pydub."""
+@dataclass
+class AudioInfo:
+    """Header facts about an input file, read without decoding it."""
+
+    channels: int
+    sample_rate: int
+    duration: float
+    # Set only by the pydub fallback, which has to decode the whole file
+    segment: Optional[AudioSegment] = None
+
+
+def _load_audio(path: Path) -> AudioInfo:
+    """Read channel count, sample rate and duration from the file header.
+
+    WAV (and anything else libsndfile reads) needs no subprocess and no
+    decode; other containers fall back to decoding via pydub/ffmpeg.
+    """
     logger.debug("Loading audio file: %s", path)
-    audio = AudioSegment.from_file(str(path))
+    try:
+        header = sf.info(str(path))
+        info = AudioInfo(header.channels, header.samplerate, header.duration)
+    except sf.LibsndfileError:
+        audio = AudioSegment.from_file(str(path))
+        info = AudioInfo(audio.channels, audio.frame_rate, len(audio) / 1000.0, segment=audio)
     logger.info(
-        "Audio loaded: channels=%d, sample_width=%d, frame_rate=%d, duration=%.2fs",
-        audio.channels,
-        audio.sample_width,
-        audio.frame_rate,
-        len(audio) / 1000.0,
+        "Audio loaded: channels=%d, frame_rate=%d, duration=%.2fs",
+        info.channels,
+        info.sample_rate,
+        info.duration,
     )
-    return audio
+    return info
+
+
+def _resample_for_whisper(waveform, sample_rate: int):  # noqa: ANN001, ANN202
+    """Resample a (channels, samples) float tensor to Whisper's 16 kHz."""
+    if sample_rate == WhisperService.SAMPLE_RATE:
+        return waveform
+    import torchaudio
+
+    return torchaudio.functional.resample(waveform, sample_rate, WhisperService.SAMPLE_RATE)
 
 
-def _split_stereo(audio: AudioSegment, workdir: Path) -> tuple[Path, Path]:
-    """Split a stereo file into two mono WAV files.
+def _read_stereo(path: Path, info: AudioInfo) -> tuple[np.ndarray, np.ndarray]:
+    """Decode a stereo recording into two mono sample arrays for Whisper.
 
-    Returns (left_path, right_path) — left is agent, right is customer.
+    Returns (left, right) as float32 at 16 kHz — left is agent, right is
+    customer.  The samples go to Whisper in memory, with no intermediate
+    WAV files to write and decode again.
     """
-    if audio.channels != 2:
-        raise ValueError(f"Expected stereo audio (2 channels), got {audio.channels}")
+    if info.channels != 2:
+        raise ValueError(f"Expected stereo audio (2 channels), got {info.channels}")
+    if info.segment is not None:
+        return _split_stereo(info.segment)
 
-    channels = audio.split_to_mono()
-    left_path = workdir / "channel_left_agent.wav"
-    right_path = workdir / "channel_right_customer.wav"
+    import torch
 
-    channels[0].export(str(left_path), format="wav")
-    channels[1].export(str(right_path), format="wav")
+    samples, sample_rate = sf.read(str(path), dtype="float32", always_2d=True)
+    channels_first = torch.from_numpy(np.ascontiguousarray(samples.T))
+    left, right = _resample_for_whisper(channels_first, sample_rate).numpy()
 
-    logger.info("Stereo split complete: %s, %s", left_path.name, right_path.name)
-    return left_path, right_path
+    logger.info("Stereo split complete: %d samples per channel", len(left))
+    return left, right
+
+
+def _split_stereo(audio: AudioSegment) -> tuple[np.ndarray, np.ndarray]:
+    """:func:`_read_stereo` for a file pydub has already decoded."""
+    audio = audio.set_frame_rate(WhisperService.SAMPLE_RATE).set_sample_width(2)
+    samples = np.frombuffer(audio.get_array_of_samples(), dtype=np.int16).reshape(-1, 2)
+    left = samples[:, 0].astype(np.float32) / 32768.0
+    right = samples[:, 1].astype(np.float32) / 32768.0
+
+    logger.info("Stereo split complete: %d samples per channel", len(left))
+    return left, right
+
+
+def _whisper_samples(audio: dict) -> np.ndarray:
+    """Whisper input (mono float32 at 16 kHz) from a decoded diarizer waveform."""
+    return _resample_for_whisper(audio["waveform"], audio["sample_rate"])[0].numpy()
 
 
 # ---------------------------------------------------------------------------
@@ -113,35 +164,81 @@ def _split_stereo(audio: AudioSegment, workdir: Path) -> tuple[Path, Path]:
 # ---------------------------------------------------------------------------
 
 
-def _overlap(a_start: float, a_end: float, b_start: float, b_end: float) -> float:
-    """Return the duration of overlap between two time intervals."""
-    return max(0.0, min(a_end, b_end) - max(a_start, b_start))
+def _speaker_overlaps(
+    transcription: TranscriptionResult,
+    diarization: DiarizationResult,
+) -> np.ndarray:
+    """Seconds of overlap between each transcription segment and each speaker.
 
+    Returns an array of shape ``(len(transcription.segments),
+    len(diarization.labels))``; column *k* is ``diarization.labels[k]``.
 
-def _align_segments(
+    Diarization turns are sorted by start, so for each transcription segment
+    two binary searches bound the window of turns that can overlap it; only
+    those (typically a handful) pairs are evaluated, not all T x D.
+    """
+    n = len(transcription.segments)
+    n_labels = len(diarization.labels)
+    t_starts = np.fromiter((s.start for s in transcription.segments), np.float64, n)
+    t_ends = np.fromiter((s.end for s in transcription.segments), np.float64, n)
+
+    d_starts, d_ends, d_speakers = diarization.starts, diarization.ends, diarization.speaker_ids
+    if np.any(d_starts[1:] < d_starts[:-1]):
+        order = np.argsort(d_starts, kind="stable")
+        d_starts, d_ends, d_speakers = d_starts[order], d_ends[order], d_speakers[order]
+
+    # Turns may overlap, so ends are not sorted; their running maximum is.
+    # Turns before lo end by t_start, turns from hi on start at/after t_end.
+    lo = np.searchsorted(np.maximum.accumulate(d_ends), t_starts, side="right")
+    hi = np.searchsorted(d_starts, t_ends, side="left")
+    counts = np.maximum(hi - lo, 0)
+
+    # Flatten the candidate windows into (row, turn) pairs
+    rows = np.repeat(np.arange(n), counts)
+    offsets = np.cumsum(counts) - counts
+    cols = np.arange(counts.sum()) - np.repeat(offsets - lo, counts)
+
+    overlap = np.minimum(t_ends[rows], d_ends[cols]) - np.maximum(t_starts[rows], d_starts[cols])
+    totals = np.bincount(
+        rows * n_labels + d_speakers[cols],
+        weights=np.clip(overlap, 0.0, None),
+        minlength=n * n_labels,
+    )
+    return totals.reshape(n, n_labels)
+
+
+def _assign_raw_speakers(
     transcription: TranscriptionResult,
     diarization: DiarizationResult,
+) -> List[Optional[str]]:
+    """Best-overlapping diarization speaker for each transcription segment.
+
+    ``None`` where a segment overlaps no diarization turn.  Computed once per
+    file and shared by speaker labelling and alignment.
+    """
+    n = len(transcription.segments)
+    if not diarization.labels:
+        return [None] * n
+    overlaps = _speaker_overlaps(transcription, diarization)
+    best = overlaps.argmax(axis=1)
+    hit = overlaps[np.arange(n), best] > 0
+    labels = diarization.labels
+    return [labels[b] if h else None for b, h in zip(best.tolist(), hit.tolist())]
+
+
+def _align_segments(
+    transcription: TranscriptionResult,
+    raw_speakers: List[Optional[str]],
     speaker_map: Dict[str, SpeakerLabel],
 ) -> List[AlignedSegment]:
-    """Match each transcription segment to the best-overlapping diarization speaker.
+    """Label each transcription segment with its best-overlapping speaker's role.
 
-    For every whisper segment we compute how much time overlaps with each
-    diarization speaker and pick the one with the largest overlap.
+    *raw_speakers* is the output of :func:`_assign_raw_speakers`.
     """
     aligned: List[AlignedSegment] = []
 
-    for tseg in transcription.segments:
-        # Accumulate overlap per speaker
-        speaker_overlap: Dict[str, float] = {}
-        for dseg in diarization.segments:
-            ov = _overlap(tseg.start, tseg.end, dseg.start, dseg.end)
-            if ov > 0:
-                speaker_overlap[dseg.speaker] = (
-                    speaker_overlap.get(dseg.speaker, 0.0) + ov
-                )
-
-        if speaker_overlap:
-            raw_speaker = max(speaker_overlap, key=speaker_overlap.get)  # type: ignore[arg-type]
+    for tseg, raw_speaker in zip(transcription.segments, raw_speakers):
+        if raw_speaker is not None:
             label = speaker_map.get(raw_speaker, "customer")
         else:
             # No diarization segment overlaps — fallback
@@ -166,9 +263,9 @@ def _align_segments(
 
 
 def _avg_word_confidence(seg: TranscriptionSegment) -> Optional[float]:
-    if not seg.words:
+    if not seg.word_prob.size:
         return None
-    return sum(w.probability for w in seg.words) / len(seg.words)
+    return float(seg.word_prob.mean(dtype=np.float64))
 
 
 # ---------------------------------------------------------------------------
@@ -197,7 +294,7 @@ _AGENT_PHRASES = [
     r"kuracja",
     r"bestseller",
     r"opakowanie",
-    r"opakowań",
+    r"opakowań\b",  # \b: folded, "opakowan" would also match "opakowanie"
     # Prices & numbers
     r"\d+\s*zł",
     r"\d+\s*złotych",
@@ -205,7 +302,7 @@ _AGENT_PHRASES = [
     r"oszczędność",
     r"za opakowanie",
     r"za pobraniem",
-    r"płatność",
+    r"płatność\b",  # ditto "platnosci"
     r"metoda płatności",
     # Order & delivery
     r"dane dostawy",
@@ -265,21 +362,50 @@ _CUSTOMER_SHORT_RESPONSES = [
 ]
 
 
-def _count_phrase_matches(text: str, patterns: list[str]) -> int:
-    """Count how many patterns match in the given text."""
-    text_lower = text.lower()
-    return sum(1 for p in patterns if re.search(p, text_lower))
+# ASR output is inconsistent about Polish diacritics ("dziękuję" /
+# "dziekuje"), so patterns and texts are both matched with them folded away
+_POLISH_FOLD = str.maketrans("ąćęłńóśźżĄĆĘŁŃÓŚŹŻ", "acelnoszzACELNOSZZ")
 
 
-def _count_distinct_phrase_matches(text: str, patterns: list[str]) -> int:
-    """Count how many *distinct* patterns match (each pattern counted at most once)."""
-    text_lower = text.lower()
-    return sum(1 for p in patterns if re.search(p, text_lower))
+def _fold(patterns: List[str]) -> List[str]:
+    return [p.translate(_POLISH_FOLD) for p in patterns]
+
+
+# Compiled once; IGNORECASE stands in for lowercasing every text
+_AGENT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in _fold(_AGENT_PHRASES))
+
+
+# Each list fused into one alternation: a single scan answers "does any
+# pattern match".  Counting still needs the separate patterns, since an
+# alternation reports one pattern per position and several phrases overlap
+# ("dzwonię z" / "dzwonię ze", "czy mogę zaproponować" / "mogę zaproponować").
+_AGENT_ANY = re.compile(
+    "|".join(f"(?:{p})" for p in _fold(_AGENT_PHRASES)), re.IGNORECASE
+)
+_CUSTOMER_ANY = re.compile(
+    "|".join(f"(?:{p})" for p in _fold(_CUSTOMER_SHORT_RESPONSES)), re.IGNORECASE
+)
+
+
+def _count_phrase_matches(text: str, patterns: tuple[re.Pattern, ...]) -> int:
+    """Count how many *distinct* patterns match (each pattern counted at most once).
+
+    *text* must already be folded with ``_POLISH_FOLD``.
+    """
+    return sum(1 for p in patterns if p.search(text))
+
+
+def _count_agent_phrases(text: str) -> int:
+    """Distinct agent phrases in *text*; one scan when there are none."""
+    if not _AGENT_ANY.search(text):
+        return 0
+    return _count_phrase_matches(text, _AGENT_PATTERNS)
 
 
 def _label_speakers_smart(
     diarization: DiarizationResult,
     transcription: TranscriptionResult,
+    raw_speakers: List[Optional[str]],
 ) -> Dict[str, SpeakerLabel]:
     """Multi-signal heuristic to identify agent vs customer.
 
@@ -296,100 +422,98 @@ def _label_speakers_smart(
         return {}
 
     # --- Gather diarization stats per speaker ---
-    speaking_time: Dict[str, float] = {}
-    first_appearance: Dict[str, float] = {}
-    segment_count: Dict[str, int] = {}
-
-    for seg in diarization.segments:
-        dur = seg.end - seg.start
-        speaking_time[seg.speaker] = speaking_time.get(seg.speaker, 0.0) + dur
-        segment_count[seg.speaker] = segment_count.get(seg.speaker, 0) + 1
-        if seg.speaker not in first_appearance:
-            first_appearance[seg.speaker] = seg.start
+    # Aggregated over the struct-of-arrays view; labels are in order of
+    # first appearance, so dict order matches the per-segment loop it replaces.
+    labels = diarization.labels
+    ids = diarization.speaker_ids
+    durations = np.bincount(
+        ids, weights=diarization.ends - diarization.starts, minlength=len(labels)
+    )
+    _, first_index = np.unique(ids, return_index=True)
+    speaking_time: Dict[str, float] = dict(zip(labels, durations.tolist()))
+    first_appearance: Dict[str, float] = dict(
+        zip(labels, diarization.starts[first_index].tolist())
+    )
+    total_time = sum(speaking_time.values())
+    earliest_start = min(first_appearance.values())
 
     # Pick top-2 by speaking time
     top_speakers = sorted(speaking_time, key=speaking_time.get, reverse=True)[:2]  # type: ignore[arg-type]
 
     # --- Align transcription text to speakers (for analysis) ---
+    # Each segment is tokenised and diacritic-folded once, here;
+    # WhisperService already strips text
     speaker_texts: Dict[str, List[str]] = {sp: [] for sp in top_speakers}
+    speaker_words: Dict[str, List[int]] = {sp: [] for sp in top_speakers}
 
-    for tseg in transcription.segments:
-        speaker_overlap: Dict[str, float] = {}
-        for dseg in diarization.segments:
-            ov = _overlap(tseg.start, tseg.end, dseg.start, dseg.end)
-            if ov > 0:
-                speaker_overlap[dseg.speaker] = (
-                    speaker_overlap.get(dseg.speaker, 0.0) + ov
-                )
-        if speaker_overlap:
-            best = max(speaker_overlap, key=speaker_overlap.get)  # type: ignore[arg-type]
-            if best in speaker_texts:
-                speaker_texts[best].append(tseg.text.strip())
+    for tseg, best in zip(transcription.segments, raw_speakers):
+        if best in speaker_texts:
+            speaker_texts[best].append(tseg.text.translate(_POLISH_FOLD))
+            speaker_words[best].append(len(tseg.text.split()))
 
     # --- Score each speaker ---
     scores: Dict[str, float] = {sp: 0.0 for sp in top_speakers}
+    # Per-speaker breakdown for the results log line; skipped when INFO is off
+    log_details = logger.isEnabledFor(logging.INFO)
     debug_info: Dict[str, Dict] = {}
 
     for sp in top_speakers:
-        all_text = " ".join(speaker_texts[sp])
-        info: Dict = {}
+        texts = speaker_texts[sp]
+        all_text = " ".join(texts)
+        word_counts = np.asarray(speaker_words[sp], dtype=np.int64)
 
         # Signal 1: Formal/sales phrases (strong signal, +3 per match)
-        agent_phrase_count = _count_phrase_matches(all_text, _AGENT_PHRASES)
+        agent_phrase_count = _count_agent_phrases(all_text)
         scores[sp] += agent_phrase_count * 3.0
-        info["agent_phrases"] = agent_phrase_count
 
         # Signal 2: Short customer response patterns (-2 per match)
-        short_responses = sum(
-            1 for t in speaker_texts[sp]
-            if _count_phrase_matches(t, _CUSTOMER_SHORT_RESPONSES) > 0
-        )
+        short_responses = sum(1 for t in texts if _CUSTOMER_ANY.search(t))
         scores[sp] -= short_responses * 2.0
-        info["customer_responses"] = short_responses
 
         # Signal 3: Short segments by word count (< 5 words = customer-like, -1.5 each)
-        short_segments = sum(1 for t in speaker_texts[sp] if len(t.split()) < 5)
+        short_segments = int(np.count_nonzero(word_counts < 5))
         scores[sp] -= short_segments * 1.5
-        info["short_segments"] = short_segments
 
         # Signal 4: Total speaking time (agent speaks more, +2 if majority)
-        total_time = sum(speaking_time.values())
         time_pct = speaking_time[sp] / total_time if total_time > 0 else 0
         if time_pct > 0.55:
             scores[sp] += 2.0
-        info["time_pct"] = round(time_pct * 100, 1)
 
         # Signal 5: Average words per segment (agent has longer turns, +1 if > 8)
         avg_words = 0.0
-        if speaker_texts[sp]:
-            avg_words = sum(len(t.split()) for t in speaker_texts[sp]) / len(speaker_texts[sp])
+        if word_counts.size:
+            avg_words = int(word_counts.sum()) / word_counts.size
             if avg_words > 8:
                 scores[sp] += 1.0
-        info["avg_words"] = round(avg_words, 1)
 
         # Signal 6: Diversity of agent phrases (+2 bonus if >= 3 distinct types)
-        distinct_agent = _count_distinct_phrase_matches(all_text, _AGENT_PHRASES)
-        if distinct_agent >= 3:
+        # Signal 1 already counts each pattern at most once
+        if agent_phrase_count >= 3:
             scores[sp] += 2.0
-        info["distinct_agent_phrases"] = distinct_agent
 
         # Signal 7: Speaks first (weak tiebreaker, +0.5)
-        if first_appearance.get(sp, float("inf")) == min(first_appearance.values()):
+        if first_appearance[sp] == earliest_start:
             scores[sp] += 0.5
 
-        info["total_segments"] = len(speaker_texts[sp])
-        info["speaking_time"] = round(speaking_time[sp], 1)
-        debug_info[sp] = info
+        if log_details:
+            debug_info[sp] = {
+                "agent_phrases": agent_phrase_count,
+                "customer_responses": short_responses,
+                "short_segments": short_segments,
+                "time_pct": time_pct * 100,
+                "avg_words": avg_words,
+                "total_segments": len(texts),
+            }
 
     # --- Handle single-speaker edge case ---
     if len(top_speakers) == 1:
         sp = top_speakers[0]
-        info = debug_info[sp]
         # If no agent language and mostly short responses, label as customer
-        if info["agent_phrases"] == 0 and info["short_segments"] > info["total_segments"] * 0.5:
+        # (the loop variables still hold this one speaker's signals)
+        if agent_phrase_count == 0 and short_segments > len(texts) * 0.5:
             logger.info(
                 "Single speaker %s labelled as 'customer' (no agent phrases, %d/%d short segments)",
-                sp, info["short_segments"], info["total_segments"],
+                sp, short_segments, len(texts),
             )
             return {sp: "customer"}
         logger.info("Single speaker %s labelled as 'agent' (score=%.1f)", sp, scores[sp])
@@ -402,21 +526,21 @@ def _label_speakers_smart(
     else:
         agent, customer = b, a
 
-    logger.info(
-        "Speaker labelling results:\n"
-        "  %s → AGENT  (score=%.1f, time=%.1fs [%.0f%%], agent_phrases=%d [%d distinct], "
-        "short_responses=%d, short_segs=%d, avg_words=%.1f, segments=%d)\n"
-        "  %s → CUSTOMER (score=%.1f, time=%.1fs [%.0f%%], agent_phrases=%d [%d distinct], "
-        "short_responses=%d, short_segs=%d, avg_words=%.1f, segments=%d)",
-        agent, scores[agent], debug_info[agent]["speaking_time"], debug_info[agent]["time_pct"],
-        debug_info[agent]["agent_phrases"], debug_info[agent]["distinct_agent_phrases"],
-        debug_info[agent]["customer_responses"], debug_info[agent]["short_segments"],
-        debug_info[agent]["avg_words"], debug_info[agent]["total_segments"],
-        customer, scores[customer], debug_info[customer]["speaking_time"], debug_info[customer]["time_pct"],
-        debug_info[customer]["agent_phrases"], debug_info[customer]["distinct_agent_phrases"],
-        debug_info[customer]["customer_responses"], debug_info[customer]["short_segments"],
-        debug_info[customer]["avg_words"], debug_info[customer]["total_segments"],
-    )
+    if log_details:
+        line = (
+            "%s → %s (score=%.1f, time=%.1fs [%.0f%%], agent_phrases=%d, "
+            "short_responses=%d, short_segs=%d, avg_words=%.1f, segments=%d)"
+        )
+        details = []
+        for sp, role in ((agent, "AGENT "), (customer, "CUSTOMER")):
+            info = debug_info[sp]
+            details.append(line % (
+                sp, role, scores[sp], speaking_time[sp], info["time_pct"],
+                info["agent_phrases"],
+                info["customer_responses"], info["short_segments"],
+                info["avg_words"], info["total_segments"],
+            ))
+        logger.info("Speaker labelling results:\n  %s\n  %s", *details)
 
     return {agent: "agent", customer: "customer"}
 
@@ -426,51 +550,47 @@ def _label_speakers_smart(
 # ---------------------------------------------------------------------------
 
 
+def _transcribe_channel(
+    whisper: WhisperService,
+    samples: np.ndarray,
+    speaker: SpeakerLabel,
+) -> tuple[List[AlignedSegment], TranscriptionStream]:
+    """Transcribe one stereo channel, labelling segments as they are decoded."""
+    stream = whisper.stream(samples)
+    segments = [
+        AlignedSegment(
+            speaker=speaker,
+            text=seg.text,
+            start=seg.start,
+            end=seg.end,
+            confidence=_avg_word_confidence(seg),
+        )
+        for seg in stream.segments
+    ]
+    logger.info("Transcribed %s channel: %d segments", speaker, len(segments))
+    return segments, stream
+
+
 def _run_stereo_pipeline(
-    audio: AudioSegment,
+    info: AudioInfo,
     audio_path: Path,
     whisper: WhisperService,
 ) -> PipelineResult:
     """Process a stereo recording by splitting channels."""
     logger.info("Stereo pipeline: splitting channels for %s", audio_path.name)
 
-    with tempfile.TemporaryDirectory(prefix="transcriptor_") as tmpdir:
-        workdir = Path(tmpdir)
-        left_path, right_path = _split_stereo(audio, workdir)
-
-        # Transcribe each channel
-        logger.info("Transcribing agent channel (left) …")
-        agent_result = whisper.transcribe(left_path)
-
-        logger.info("Transcribing customer channel (right) …")
-        customer_result = whisper.transcribe(right_path)
-
-    # Build aligned segments from both channels
-    segments: List[AlignedSegment] = []
-
-    for seg in agent_result.segments:
-        segments.append(
-            AlignedSegment(
-                speaker="agent",
-                text=seg.text,
-                start=seg.start,
-                end=seg.end,
-                confidence=_avg_word_confidence(seg),
-            )
-        )
+    left, right = _read_stereo(audio_path, info)
 
-    for seg in customer_result.segments:
-        segments.append(
-            AlignedSegment(
-                speaker="customer",
-                text=seg.text,
-                start=seg.start,
-                end=seg.end,
-                confidence=_avg_word_confidence(seg),
-            )
-        )
+    # Transcribe both channels at once; CTranslate2 releases the GIL
+    logger.info("Transcribing agent (left) and customer (right) channels …")
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="channel") as pool:
+        agent_future = pool.submit(_transcribe_channel, whisper, left, "agent")
+        customer_future = pool.submit(_transcribe_channel, whisper, right, "customer")
+        agent_segments, agent_result = agent_future.result()
+        customer_segments, customer_result = customer_future.result()
 
-    # Sort by time
+    # Each channel is already in time order, so this sort is a linear merge
+    segments = agent_segments + customer_segments
     segments.sort(key=lambda s: s.start)
 
     full_text = _build_full_text(segments)
@@ -495,23 +615,33 @@ def _run_mono_pipeline(
     audio_path: Path,
     whisper: WhisperService,
     diarizer: PyannoteDiarizer,
+    prefetched_audio: Optional[dict] = None,
 ) -> PipelineResult:
-    """Process a mono recording: diarize → transcribe → align."""
+    """Process a mono recording: diarize + transcribe → align."""
     logger.info("Mono pipeline for %s", audio_path.name)
 
-    # Step 1: Diarize
-    logger.info("Running speaker diarization …")
-    diarization = diarizer.diarize(audio_path)
+    # Decode once; both models read the same samples
+    audio = prefetched_audio
+    if audio is None:
+        audio = diarizer.load_waveform(audio_path)
+
+    # Steps 1+2: the two models are independent, so diarize on a worker
+    # thread while transcribing here.  Neither keeps the GPU busy on its
+    # own, and both release the GIL inside their kernels.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="diarize") as pool:
+        logger.info("Running speaker diarization …")
+        diarization_future = pool.submit(diarize_cached, audio_path, diarizer, audio=audio)
 
-    # Step 2: Transcribe
-    logger.info("Running transcription …")
-    transcription = whisper.transcribe(audio_path)
+        logger.info("Running transcription …")
+        transcription = whisper.transcribe(audio_path, audio=_whisper_samples(audio))
+        diarization = diarization_future.result()
 
     # Step 3: Label speakers (using transcription text for smart heuristics)
-    speaker_map = _label_speakers_smart(diarization, transcription)
+    raw_speakers = _assign_raw_speakers(transcription, diarization)
+    speaker_map = _label_speakers_smart(diarization, transcription, raw_speakers)
 
     # Step 4: Align
-    segments = _align_segments(transcription, diarization, speaker_map)
+    segments = _align_segments(transcription, raw_speakers, speaker_map)
 
     full_text = _build_full_text(segments)
 
@@ -532,13 +662,21 @@ def _run_mono_pipeline(
 # ---------------------------------------------------------------------------
 
 
+# Line prefix per speaker label in the readable transcript
+_FULL_TEXT_PREFIX: Dict[str, str] = {"agent": "[Agent] ", "customer": "[Customer] "}
+
+
 def _build_full_text(segments: List[AlignedSegment]) -> str:
     """Build a readable transcript with speaker labels."""
-    lines: List[str] = []
-    for seg in segments:
-        label = seg.speaker.capitalize()
-        lines.append(f"[{label}] {seg.text}")
-    return "\n".join(lines)
+    # A list comprehension, not a generator: join() materialises it anyway.
+    # Labels other than agent/customer fall back to the capitalised name.
+    return "\n".join(
+        [
+            (_FULL_TEXT_PREFIX.get(seg.speaker) or f"[{seg.speaker.capitalize()}] ")
+            + seg.text
+            for seg in segments
+        ]
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -557,13 +695,38 @@ class TranscriptionPipeline:
         self._whisper = whisper or WhisperService()
         self._diarizer = diarizer or PyannoteDiarizer()
 
-    def process(self, audio_path: str | Path) -> PipelineResult:
+    def warmup(self) -> None:
+        """Load both models up front, in parallel.
+
+        Otherwise the first mono file loads them lazily inside the two
+        concurrent diarize/transcribe threads, one after the other.
+        """
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="warmup") as pool:
+            diarizer_loaded = pool.submit(self._diarizer.warmup)
+            self._whisper.warmup()
+            diarizer_loaded.result()
+
+    def prefetch_audio(self, audio_path: str | Path) -> dict:
+        """Decode *audio_path* for diarization ahead of :meth:`process`.
+
+        Lets batch callers decode the next file on a worker thread while the
+        current one is still running through the models.
+        """
+        return self._diarizer.load_waveform(audio_path)
+
+    def process(
+        self,
+        audio_path: str | Path,
+        prefetched_audio: Optional[dict] = None,
+    ) -> PipelineResult:
         """Run the full pipeline on *audio_path*.
 
         Parameters
         ----------
         audio_path:
             Path to a WAV file (mono or stereo).
+        prefetched_audio:
+            Result of :meth:`prefetch_audio` for the same file, if available.
 
         Returns
         -------
@@ -585,15 +748,18 @@ class TranscriptionPipeline:
         logger.info("Pipeline started for %s", audio_path)
 
         try:
-            audio = _load_audio(audio_path)
+            info = _load_audio(audio_path)
         except Exception:
             logger.exception("Failed to load audio file %s", audio_path)
             raise
 
-        if audio.channels >= 2:
-            result = _run_stereo_pipeline(audio, audio_path, self._whisper)
+        # Mono files are never decoded here; the models decode them once
+        if info.channels >= 2:
+            result = _run_stereo_pipeline(info, audio_path, self._whisper)
         else:
-            result = _run_mono_pipeline(audio_path, self._whisper, self._diarizer)
+            result = _run_mono_pipeline(
+                audio_path, self._whisper, self._diarizer, prefetched_audio
+            )
 
         logger.info(
             "Pipeline complete: %d segments, mode=%s, duration=%.2fs",
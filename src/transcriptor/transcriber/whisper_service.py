@@ -8,23 +8,30 @@ the language and model size are driven by :pydata:`transcriptor.config.settings`
 from __future__ import annotations
 
 import logging
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from faster_whisper import WhisperModel
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 
 from transcriptor.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Loaded models keyed by (model size, device, compute type, workers).  A model
+# is several GB, so every WhisperService with the same settings shares one.
+_MODEL_CACHE: Dict[Tuple[str, str, str, int], WhisperModel] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Data classes returned by the service
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class WordTimestamp:
     word: str
     start: float
@@ -32,17 +39,41 @@ class WordTimestamp:
     probability: float
 
 
-@dataclass
+def _empty(dtype) -> np.ndarray:  # noqa: ANN001
+    return np.empty(0, dtype)
+
+
+@dataclass(slots=True)
 class TranscriptionSegment:
-    """A single segment produced by Whisper."""
+    """A single segment produced by Whisper.
+
+    Word timestamps are stored column-wise (one array per attribute) rather
+    than as a :class:`WordTimestamp` object per word; :attr:`words` builds
+    those objects on demand.
+    """
 
     text: str
     start: float
     end: float
-    words: List[WordTimestamp] = field(default_factory=list)
+    word_text: List[str] = field(default_factory=list)
+    word_start: np.ndarray = field(default_factory=lambda: _empty(np.float64))
+    word_end: np.ndarray = field(default_factory=lambda: _empty(np.float64))
+    word_prob: np.ndarray = field(default_factory=lambda: _empty(np.float32))
     avg_logprob: float = 0.0
     no_speech_prob: float = 0.0
 
+    @property
+    def words(self) -> List[WordTimestamp]:
+        return [
+            WordTimestamp(word, start, end, prob)
+            for word, start, end, prob in zip(
+                self.word_text,
+                self.word_start.tolist(),
+                self.word_end.tolist(),
+                self.word_prob.tolist(),
+            )
+        ]
+
 
 @dataclass
 class TranscriptionResult:
@@ -52,6 +83,16 @@ class TranscriptionResult:
     duration: float
 
 
+@dataclass
+class TranscriptionStream:
+    """A transcription in progress: segments are decoded as they are consumed."""
+
+    segments: Iterator[TranscriptionSegment]
+    language: str
+    language_probability: float
+    duration: float
+
+
 # ---------------------------------------------------------------------------
 # Service
 # ---------------------------------------------------------------------------
@@ -61,6 +102,10 @@ class WhisperService:
     """Thin wrapper around *faster-whisper* that lazily loads the model."""
 
     DEFAULT_BEAM_SIZE = 5
+    SAMPLE_RATE = 16000
+    # Call recordings: long silences between short turns, so split on
+    # shorter pauses than faster-whisper's default and pad speech tightly
+    DEFAULT_VAD_PARAMETERS = {"min_silence_duration_ms": 300, "speech_pad_ms": 100}
 
     def __init__(
         self,
@@ -68,104 +113,191 @@ class WhisperService:
         device: Optional[str] = None,
         compute_type: Optional[str] = None,
         language: Optional[str] = None,
+        batch_size: Optional[int] = None,
     ) -> None:
         self._model_size = model_size or settings.WHISPER_MODEL_SIZE
         self._device = device or settings.WHISPER_DEVICE
         self._compute_type = compute_type or settings.WHISPER_COMPUTE_TYPE
         self._language = language or settings.WHISPER_LANGUAGE
+        if batch_size is None:
+            batch_size = settings.WHISPER_BATCH_SIZE
+        # VAD chunks decoded per encoder/decoder pass; 0 or 1 decodes sequentially
+        self._batch_size = batch_size
         self._model: Optional[WhisperModel] = None
+        self._batched: Optional[BatchedInferencePipeline] = None
 
     # -- lazy init ----------------------------------------------------------
 
     def _get_model(self) -> WhisperModel:
+        """Load the Whisper model on first use (shared process-wide)."""
         if self._model is None:
-            logger.info(
-                "Loading Whisper model %s (device=%s, compute=%s)",
+            if self._compute_type == "auto":
+                self._compute_type = self._auto_compute_type()
+            key = (
                 self._model_size,
                 self._device,
                 self._compute_type,
+                settings.WHISPER_NUM_WORKERS,
             )
-            device = self._device
-            if device == "auto":
-                device = "cuda"  # faster-whisper defaults; falls back internally
-            self._model = WhisperModel(
-                self._model_size,
-                device=device,
-                compute_type=self._compute_type,
-            )
-            logger.info("Whisper model loaded successfully.")
+            # Also serialises first use from the two stereo-channel threads
+            with _MODEL_CACHE_LOCK:
+                if key not in _MODEL_CACHE:
+                    _MODEL_CACHE[key] = self._load_model()
+                self._model = _MODEL_CACHE[key]
         return self._model
 
+    def _get_batched(self) -> BatchedInferencePipeline:
+        """Batched front end over the shared model (cheap: holds no weights)."""
+        if self._batched is None:
+            self._batched = BatchedInferencePipeline(model=self._get_model())
+        return self._batched
+
+    def _auto_compute_type(self) -> str:
+        """INT8 weights: int8_float16 on CUDA, int8 on CPU."""
+        import ctranslate2
+
+        if self._device == "cpu" or ctranslate2.get_cuda_device_count() == 0:
+            return "int8"
+        return "int8_float16"
+
+    def _load_model(self) -> WhisperModel:
+        logger.info(
+            "Loading Whisper model %s (device=%s, compute=%s)",
+            self._model_size,
+            self._device,
+            self._compute_type,
+        )
+        device = self._device
+        if device == "auto":
+            device = "cuda"  # faster-whisper defaults; falls back internally
+        model = WhisperModel(
+            self._model_size,
+            device=device,
+            compute_type=self._compute_type,
+            # Without extra workers concurrent calls queue on one replica
+            num_workers=settings.WHISPER_NUM_WORKERS,
+        )
+        logger.info("Whisper model loaded successfully.")
+        return model
+
     # -- public API ---------------------------------------------------------
 
-    def transcribe(
+    def warmup(self) -> None:
+        """Load the model now rather than on the first :meth:`transcribe`."""
+        self._get_model()
+
+    def stream(
         self,
-        audio_path: str | Path,
+        audio_path: str | Path | np.ndarray,
         *,
         language: Optional[str] = None,
         beam_size: Optional[int] = None,
-    ) -> TranscriptionResult:
-        """Transcribe *audio_path* and return structured results with word timestamps.
+        audio: Optional[np.ndarray] = None,
+        vad_parameters: Optional[dict] = None,
+    ) -> TranscriptionStream:
+        """Start transcribing *audio_path*; segments are yielded as Whisper decodes them.
 
-        Parameters
-        ----------
-        audio_path:
-            Path to a WAV (or any ffmpeg-supported) file.
-        language:
-            Override the default language.
-        beam_size:
-            Override the default beam size.
+        Language and duration are known before the first segment.  Arguments
+        are as for :meth:`transcribe`.
         """
-        audio_path = Path(audio_path)
-        if not audio_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if isinstance(audio_path, np.ndarray):
+            audio, name = audio_path, "in-memory audio"
+        else:
+            audio_path = Path(audio_path)
+            if not audio_path.exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_path}")
+            name = audio_path.name
 
         model = self._get_model()
         lang = language or self._language
         bs = beam_size or self.DEFAULT_BEAM_SIZE
 
-        logger.info("Transcribing %s (lang=%s, beam=%d)", audio_path.name, lang, bs)
+        logger.info("Transcribing %s (lang=%s, beam=%d)", name, lang, bs)
+
+        kwargs = {}
+        if self._batch_size > 1:
+            # Decode several VAD chunks of the file per forward pass
+            model = self._get_batched()
+            kwargs["batch_size"] = self._batch_size
 
         segments_gen, info = model.transcribe(
-            str(audio_path),
+            str(audio_path) if audio is None else audio,
             language=lang,
             beam_size=bs,
             word_timestamps=True,
             vad_filter=True,
+            vad_parameters=vad_parameters or self.DEFAULT_VAD_PARAMETERS,
+            **kwargs,
+        )
+        return TranscriptionStream(
+            segments=self._convert_segments(segments_gen),
+            language=info.language,
+            language_probability=info.language_probability,
+            duration=info.duration,
         )
 
-        segments: List[TranscriptionSegment] = []
+    @staticmethod
+    def _convert_segments(segments_gen) -> Iterator[TranscriptionSegment]:  # noqa: ANN001
         for seg in segments_gen:
-            words = [
-                WordTimestamp(
-                    word=w.word.strip(),
-                    start=w.start,
-                    end=w.end,
-                    probability=w.probability,
-                )
-                for w in (seg.words or [])
-            ]
-            segments.append(
-                TranscriptionSegment(
-                    text=seg.text.strip(),
-                    start=seg.start,
-                    end=seg.end,
-                    words=words,
-                    avg_logprob=seg.avg_logprob,
-                    no_speech_prob=seg.no_speech_prob,
-                )
+            words = seg.words or ()
+            n = len(words)
+            yield TranscriptionSegment(
+                text=seg.text.strip(),
+                start=seg.start,
+                end=seg.end,
+                word_text=[w.word.strip() for w in words],
+                word_start=np.fromiter((w.start for w in words), np.float64, n),
+                word_end=np.fromiter((w.end for w in words), np.float64, n),
+                word_prob=np.fromiter((w.probability for w in words), np.float32, n),
+                avg_logprob=seg.avg_logprob,
+                no_speech_prob=seg.no_speech_prob,
             )
 
+    def transcribe(
+        self,
+        audio_path: str | Path | np.ndarray,
+        *,
+        language: Optional[str] = None,
+        beam_size: Optional[int] = None,
+        audio: Optional[np.ndarray] = None,
+        vad_parameters: Optional[dict] = None,
+    ) -> TranscriptionResult:
+        """Transcribe *audio_path* and return structured results with word timestamps.
+
+        Parameters
+        ----------
+        audio_path:
+            Path to a WAV (or any ffmpeg-supported) file, or mono float32
+            samples at :attr:`SAMPLE_RATE`.
+        language:
+            Override the default language.
+        beam_size:
+            Override the default beam size.
+        audio:
+            The file already decoded to mono float32 samples at
+            :attr:`SAMPLE_RATE`; decoded here if omitted.
+        vad_parameters:
+            Override :attr:`DEFAULT_VAD_PARAMETERS` for the VAD filter.
+        """
+        stream = self.stream(
+            audio_path,
+            language=language,
+            beam_size=beam_size,
+            audio=audio,
+            vad_parameters=vad_parameters,
+        )
+        segments = list(stream.segments)
+
         logger.info(
             "Transcription complete: %d segments, detected lang=%s (%.2f)",
             len(segments),
-            info.language,
-            info.language_probability,
+            stream.language,
+            stream.language_probability,
         )
 
         return TranscriptionResult(
             segments=segments,
-            language=info.language,
-            language_probability=info.language_probability,
-            duration=info.duration,
+            language=stream.language,
+            language_probability=stream.language_probability,
+            duration=stream.duration,
         )
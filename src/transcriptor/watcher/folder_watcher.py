@@ -1,30 +1,177 @@
 """Folder watcher that monitors a directory for new .wav files and processes them."""
 
+import collections
+import contextlib
+import functools
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
 import queue
+import signal
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process claim
+    fcntl = None
+
+from sqlalchemy import func, insert, literal, select
+from sqlalchemy.exc import IntegrityError
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
+from transcriptor.config import settings
+from transcriptor.db.database import SessionLocal, init_db
+from transcriptor.db.models import Recording, Segment, Transcript
+
 logger = logging.getLogger("transcriptor")
 
 
-class WavFileHandler(FileSystemEventHandler):
-    """Handles new .wav files appearing in the watched directory."""
+def _is_wav(path: str) -> bool:
+    # Checked on the raw event path before building a Path: busy folders see
+    # far more events for other files than for recordings
+    return path[-4:].lower() == ".wav"
+
 
-    def __init__(self, processing_queue: queue.Queue):
+class WavFileHandler(FileSystemEventHandler):
+    """Handles new .wav files appearing in the watched directory.
+
+    A new file is queued as soon as its writer closes it (inotify's
+    close-write event).  Observers without close events fall back to a
+    settle timer: the file is queued once it has gone ``settle_seconds``
+    without further write events and without changing size, so copies in
+    progress are not picked up half-written.  A repeated create event for a
+    file queued within the last ``RECENT_SECONDS`` is dropped rather than
+    queueing it again.  Consumers call :meth:`mark_started` when a worker
+    takes a path off the queue.
+    """
+
+    RECENT_SECONDS = 2.0
+
+    def __init__(
+        self,
+        processing_queue: queue.SimpleQueue,
+        settle_seconds: float = 0.5,
+    ):
         super().__init__()
         self.processing_queue = processing_queue
+        self.settle_seconds = settle_seconds
+        self._timers: dict[Path, threading.Timer] = {}
+        # Path -> monotonic time it was last queued
+        self._recent: dict[Path, float] = {}
+        # In processing_queue, not yet taken by a worker
+        self._queued: set[Path] = set()
+        self._lock = threading.Lock()
 
     def on_created(self, event):
-        if event.is_directory:
+        if event.is_directory or not _is_wav(event.src_path):
+            return
+        self._on_new(Path(event.src_path))
+
+    def on_moved(self, event):
+        # Writers that finish into a temporary name and rename it into place
+        if event.is_directory or not _is_wav(event.dest_path):
+            return
+        self._on_new(Path(event.dest_path))
+
+    def on_closed(self, event):
+        if event.is_directory or not _is_wav(event.src_path):
+            return
+        path = Path(event.src_path)
+        # The writer is done: queue a pending file without waiting to settle
+        with self._lock:
+            timer = self._timers.pop(path, None)
+            if timer is None:
+                return
+            timer.cancel()
+            self._mark_queued(path)
+        self.processing_queue.put(path)
+
+    def is_pending(self, path: Path) -> bool:
+        """Whether *path* is settling or queued and not yet taken by a worker."""
+        with self._lock:
+            return path in self._timers or path in self._queued
+
+    def mark_started(self, path: Path) -> None:
+        """Record that a worker took *path* off the queue."""
+        with self._lock:
+            self._queued.discard(path)
+
+    def schedule_file(self, path: Path) -> None:
+        """Queue *path* once it has settled, as if an event had announced it."""
+        self._schedule(path)
+
+    def _on_new(self, path: Path):
+        with self._lock:
+            queued_at = self._recent.get(path)
+        if queued_at is not None and time.monotonic() - queued_at < self.RECENT_SECONDS:
+            return
+        logger.info(f"New WAV file detected: {path.name}")
+        self._schedule(path)
+
+    def on_modified(self, event):
+        if event.is_directory or not _is_wav(event.src_path):
             return
         path = Path(event.src_path)
-        if path.suffix.lower() == ".wav":
-            logger.info(f"New WAV file detected: {path.name}")
+        # Only files still settling get their deadline pushed back
+        with self._lock:
+            pending = path in self._timers
+        if pending:
+            self._schedule(path)
+
+    @staticmethod
+    def _size(path: Path) -> int | None:
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return None
+
+    def _schedule(self, path: Path, size: int | None = None):
+        if size is None:
+            size = self._size(path)
+        with self._lock:
+            timer = self._timers.get(path)
+            if timer is not None:
+                timer.cancel()
+            timer = threading.Timer(self.settle_seconds, self._enqueue, args=(path, size))
+            timer.daemon = True
+            self._timers[path] = timer
+            timer.start()
+
+    def _enqueue(self, path: Path, size: int | None):
+        current_size = self._size(path)
+        with self._lock:
+            # A timer that fired just as it was replaced must not queue the file
+            if self._timers.get(path) is not threading.current_thread():
+                return
+            if current_size is None:
+                # Removed (or renamed away) before it settled
+                del self._timers[path]
+                return
+            settled = current_size == size
+            if settled:
+                del self._timers[path]
+                self._mark_queued(path)
+        if settled:
             self.processing_queue.put(path)
+        else:
+            # Grew without a modify event reaching us: wait another period
+            self._schedule(path, current_size)
+
+    def _mark_queued(self, path: Path):
+        """Record that *path* was queued; call with ``_lock`` held."""
+        now = time.monotonic()
+        # Prune here, the only place entries are added
+        self._recent = {
+            p: t for p, t in self._recent.items() if now - t < self.RECENT_SECONDS
+        }
+        self._recent[path] = now
+        self._queued.add(path)
 
 
 def _setup_logging(log_dir: Path):
@@ -51,143 +198,633 @@ def _setup_logging(log_dir: Path):
         root_logger.addHandler(console_handler)
 
 
-def _process_file(file_path: Path):
-    """Run the transcription pipeline on a single file and persist results."""
-    from datetime import datetime
+# Progress events, one JSON object per line, for dashboards and scripts that
+# follow processing without polling the database (see _emit_event)
+_EVENTS_PATH = Path("logs") / "events.jsonl"
+_events_fd: int | None = None
+_events_lock = threading.Lock()
+
+
+def _emit_event(event_type: str, **fields) -> None:
+    """Append a ``{"type": event_type, "ts": ..., **fields}`` line to the event log.
+
+    The file is opened once per process with ``O_APPEND``, so each line is a
+    single write() that concurrent workers and processes cannot interleave.
+    Failing to write an event never fails the processing it reports on.
+    """
+    global _events_fd
+    line = json.dumps(
+        {"type": event_type, "ts": round(time.time(), 3), **fields}, ensure_ascii=False
+    )
+    try:
+        if _events_fd is None:
+            with _events_lock:
+                if _events_fd is None:
+                    _EVENTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+                    _events_fd = os.open(
+                        _EVENTS_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+                    )
+        os.write(_events_fd, (line + "\n").encode())
+    except OSError as e:
+        logger.warning(f"Could not write progress event: {e}")
+
+
+@contextlib.contextmanager
+def _claim(file_path: Path):
+    """Hold an exclusive lock on *file_path* across processes.
+
+    Yields False if another process (a process-all worker, a watcher) is
+    already working on the file.  The lock is a sentinel file under
+    ``CACHE_DIR/locks``, so nothing is written into the watched folder.
+    """
+    if fcntl is None:
+        yield True
+        return
+
+    lock_dir = Path(settings.CACHE_DIR).expanduser() / "locks"
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    name = hashlib.blake2b(str(file_path.resolve()).encode(), digest_size=16).hexdigest()
+    lock_path = lock_dir / f"{name}.lock"
+    while True:
+        lock_file = open(lock_path, "w")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            yield False
+            return
+        # The holder unlinks the file when done; if that happened between our
+        # open and flock, we locked an orphan and must retry on a fresh file
+        try:
+            current = os.stat(lock_path).st_ino == os.fstat(lock_file.fileno()).st_ino
+        except FileNotFoundError:
+            current = False
+        if current:
+            break
+        lock_file.close()
+    try:
+        yield True
+    finally:
+        # Removed while still locked, so lock files do not pile up
+        lock_path.unlink(missing_ok=True)
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+        lock_file.close()
+
+
+# Files this process has seen finished: filepath -> (recording id, mtime_ns
+# of the file then).  Lets repeat events and re-scans skip them with a
+# primary-key check instead of the filepath lookup and ORM load.  Entries
+# are dropped by ``forget_recording`` (delete, reprocess in this process)
+# and ignored once the file on disk has changed; a hit still needs its
+# recording to be done, as another process may have deleted or reset it.
+_RECORDING_CACHE_SIZE = 10_000
+_recording_cache: collections.OrderedDict[str, tuple[int, int]] = collections.OrderedDict()
+_recording_cache_lock = threading.Lock()
+
+
+def _mtime_ns(filepath: str) -> int | None:
+    try:
+        return os.stat(filepath).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _cached_done(filepath: str) -> int | None:
+    """Id of the finished recording for *filepath*, if cached and still current."""
+    with _recording_cache_lock:
+        entry = _recording_cache.get(filepath)
+        if entry is None:
+            return None
+        _recording_cache.move_to_end(filepath)
+    recording_id, mtime_ns = entry
+    if _mtime_ns(filepath) != mtime_ns:
+        forget_recording(filepath)
+        return None
+    return recording_id
+
+
+def _remember_done(filepath: str, recording_id: int) -> None:
+    mtime_ns = _mtime_ns(filepath)
+    if mtime_ns is None:
+        return
+    with _recording_cache_lock:
+        _recording_cache[filepath] = (recording_id, mtime_ns)
+        _recording_cache.move_to_end(filepath)
+        if len(_recording_cache) > _RECORDING_CACHE_SIZE:
+            _recording_cache.popitem(last=False)
+
+
+def forget_recording(filepath: str) -> None:
+    """Drop *filepath* from the finished-file cache (deleted or reprocessed)."""
+    with _recording_cache_lock:
+        _recording_cache.pop(filepath, None)
 
-    from transcriptor.db.database import SessionLocal, init_db
-    from transcriptor.db.models import Recording, Segment, Transcript
+
+@functools.lru_cache(maxsize=1)
+def _shared_pipeline():
+    """The process-wide ``TranscriptionPipeline``, built on first use.
+
+    Entry points and worker threads all go through this one instance; its
+    models are loaded once and then reused for every file.
+    """
     from transcriptor.pipeline import TranscriptionPipeline
 
-    init_db()
+    return TranscriptionPipeline()
+
+
+def _process_file(file_path: Path, pipeline=None, prefetched_audio=None, known_new=False):
+    """Run the transcription pipeline on a single file and persist results.
+
+    *pipeline* is an already-constructed ``TranscriptionPipeline`` to reuse
+    (so its models stay loaded across files); the shared one if omitted.
+    *prefetched_audio* is the file as decoded by ``pipeline.prefetch_audio``.
+    *known_new* says the caller already found no recording for the file, so
+    its lookup is skipped.  The database must already be initialised
+    (``init_db``).
+    """
+    with _claim(file_path) as claimed:
+        if not claimed:
+            logger.info(f"Skipping {file_path.name}: being processed elsewhere")
+            return
+        _process_claimed_file(file_path, pipeline, prefetched_audio, known_new)
+
+
+def _process_claimed_file(file_path: Path, pipeline, prefetched_audio, known_new=False):
+    # The schema is set up once by the entry point (init_db), not per file
     session = SessionLocal()
+    # Both are needed several times below; derive them from the Path once
+    fp_str = str(file_path)
+    fp_name = file_path.name
 
     # Check if file already exists in DB
-    existing = session.query(Recording).filter(Recording.filepath == str(file_path)).first()
+    existing = None
+    if not known_new:
+        cached_id = _cached_done(fp_str)
+        if cached_id is not None:
+            status = session.scalar(
+                select(Recording.status).where(Recording.id == cached_id)
+            )
+            if status == "done":
+                logger.info(f"Skipping already-processed file: {fp_name}")
+                session.close()
+                return
+            forget_recording(fp_str)
+        existing = session.scalars(
+            select(Recording).where(Recording.filepath == fp_str)
+        ).first()
     if existing and existing.status == "done":
-        logger.info(f"Skipping already-processed file: {file_path.name}")
+        _remember_done(fp_str, existing.id)
+        logger.info(f"Skipping already-processed file: {fp_name}")
         session.close()
         return
 
+    # Two commits per file: this one makes the recording show up as
+    # processing, the last one stores the result.  The transaction is not
+    # held open across the pipeline run, which would block other writers.
     if existing:
         # Re-process a previously failed/pending recording
         recording = existing
-        recording.status = "pending"
+        recording.status = "processing"
         recording.error_message = None
         session.commit()
     else:
         recording = Recording(
-            filename=file_path.name,
-            filepath=str(file_path),
-            status="pending",
+            filename=fp_name,
+            filepath=fp_str,
+            status="processing",
         )
         session.add(recording)
-        session.commit()
-    logger.info(f"Recording #{recording.id} created for {file_path.name}")
+        try:
+            session.commit()
+        except IntegrityError:
+            if not known_new:
+                raise
+            # Recorded elsewhere since the caller looked; take the normal path
+            session.rollback()
+            session.close()
+            _process_claimed_file(file_path, pipeline, prefetched_audio)
+            return
+    logger.info(f"Recording #{recording.id} created for {fp_name}")
+    _emit_event("RecordingStarted", id=recording.id, path=fp_str)
 
     try:
-        recording.status = "processing"
-        session.commit()
-
-        pipeline = TranscriptionPipeline()
-        result = pipeline.process(str(file_path))
-
-        transcript = Transcript(
-            recording_id=recording.id,
-            full_text=result.full_text,
-            language=result.language,
-        )
-        session.add(transcript)
-        session.flush()
-
-        for seg in result.segments:
-            segment = Segment(
-                transcript_id=transcript.id,
-                speaker_label=seg.speaker,
-                text=seg.text,
-                start_time=seg.start,
-                end_time=seg.end,
-                confidence=seg.confidence,
+        # Assigned with the result: setting it now would autoflush an UPDATE
+        # on the next query and hold a write transaction through the run
+        content_hash = _content_hash(file_path)
+
+        # A byte-identical copy of a transcribed file gets that transcript.
+        # Only for new recordings: retries and reprocess requests re-run.
+        if existing is None:
+            source = session.scalars(
+                select(Recording)
+                .where(
+                    Recording.content_hash == content_hash,
+                    Recording.status == "done",
+                    Recording.id != recording.id,
+                )
+                .limit(1)
+            ).first()
+            if source is not None and _copy_transcript(session, source.id, recording.id):
+                recording.status = "done"
+                recording.content_hash = content_hash
+                recording.duration_seconds = source.duration_seconds
+                recording.processed_at = func.now()
+                session.commit()
+                _remember_done(fp_str, recording.id)
+                logger.info(
+                    f"Recording #{recording.id} is identical to #{source.id}; "
+                    "copied its transcript"
+                )
+                _emit_event(
+                    "RecordingDone",
+                    id=recording.id,
+                    duration=source.duration_seconds,
+                    copied_from=source.id,
+                )
+                return
+
+        if pipeline is None:
+            pipeline = _shared_pipeline()
+        result = pipeline.process(fp_str, prefetched_audio)
+
+        # Core INSERTs throughout: nothing reads these rows back as ORM
+        # objects, so the unit of work would only add flush overhead
+        transcript_id = session.execute(
+            insert(Transcript)
+            .values(
+                recording_id=recording.id,
+                full_text=result.full_text,
+                language=result.language,
+            )
+            .returning(Transcript.id)
+        ).scalar_one()
+
+        # One executemany INSERT instead of a Segment object per row
+        if result.segments:
+            session.execute(
+                insert(Segment),
+                [
+                    {
+                        "transcript_id": transcript_id,
+                        "speaker_label": seg.speaker,
+                        "text": seg.text,
+                        "start_time": seg.start,
+                        "end_time": seg.end,
+                        "confidence": seg.confidence,
+                    }
+                    for seg in result.segments
+                ],
             )
-            session.add(segment)
 
         recording.status = "done"
+        recording.content_hash = content_hash
         recording.duration_seconds = result.duration
-        recording.processed_at = datetime.utcnow()
+        recording.processed_at = func.now()
         session.commit()
+        _remember_done(fp_str, recording.id)
         logger.info(f"Recording #{recording.id} processed successfully")
+        _emit_event("RecordingDone", id=recording.id, duration=result.duration)
 
     except Exception as e:
         session.rollback()
+        _emit_event("RecordingError", id=recording.id, error=str(e))
         # Re-fetch to update status after rollback
         recording = session.get(Recording, recording.id)
         if recording:
             recording.status = "error"
             recording.error_message = str(e)
             session.commit()
-        logger.error(f"Error processing {file_path.name}: {e}", exc_info=True)
+        logger.error(f"Error processing {fp_name}: {e}", exc_info=True)
 
     finally:
         session.close()
 
 
-def process_single_file(file_path: Path):
+def _content_hash(file_path: Path) -> str:
+    """BLAKE2b hex digest of the file's bytes."""
+    digest = hashlib.blake2b(digest_size=32)
+    with file_path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _copy_transcript(session, source_recording_id: int, recording_id: int) -> bool:
+    """Copy the latest transcript of one recording, with its segments, to another.
+
+    Returns False if the source recording has no transcript.
+    """
+    source_id = session.scalar(
+        select(Transcript.id)
+        .where(Transcript.recording_id == source_recording_id)
+        .order_by(Transcript.id.desc())
+        .limit(1)
+    )
+    if source_id is None:
+        return False
+
+    # INSERT ... SELECT: the rows are copied inside the database
+    transcript_id = session.execute(
+        insert(Transcript)
+        .from_select(
+            ["recording_id", "full_text", "language", "model_used"],
+            select(
+                literal(recording_id),
+                Transcript.full_text,
+                Transcript.language,
+                Transcript.model_used,
+            ).where(Transcript.id == source_id),
+        )
+        .returning(Transcript.id)
+    ).scalar_one()
+    session.execute(
+        insert(Segment).from_select(
+            ["transcript_id", "speaker_label", "text", "start_time", "end_time", "confidence"],
+            select(
+                literal(transcript_id),
+                Segment.speaker_label,
+                Segment.text,
+                Segment.start_time,
+                Segment.end_time,
+                Segment.confidence,
+            )
+            .where(Segment.transcript_id == source_id)
+            .order_by(Segment.id),
+        )
+    )
+    return True
+
+
+def process_single_file(file_path: Path, pipeline=None):
     """Public entry point to process a single WAV file."""
     _setup_logging(Path("logs"))
     logger.info(f"Processing single file: {file_path}")
-    _process_file(file_path)
+    init_db()
+    _process_file(file_path, pipeline)
+
+
+def _init_worker(gpu_ids) -> None:
+    """Pin a process-all worker to one GPU and load its pipeline."""
+    # Must happen before torch/CTranslate2 initialise CUDA in this process
+    os.environ["CUDA_VISIBLE_DEVICES"] = str(gpu_ids.get())
+    _setup_logging(Path("logs"))
+
+    init_db()
+    _shared_pipeline().warmup()
+
+
+def _process_in_worker(file_path: Path, known_new: bool) -> None:
+    _process_file(file_path, _shared_pipeline(), known_new=known_new)
+
+
+def _gpu_count() -> int:
+    try:
+        import torch
+    except ImportError:
+        return 0
+    return torch.cuda.device_count()
+
+
+def _process_on_gpus(files: list[Path], new_files: set[Path], n_gpus: int) -> None:
+    """Spread *files* over one worker process per GPU.
+
+    *new_files* are those known to have no recording yet.
+    """
+    # spawn: CUDA cannot be used in a forked child, and the parent's pooled
+    # database connections must not be shared
+    ctx = multiprocessing.get_context("spawn")
+    gpu_ids = ctx.Queue()
+    for i in range(n_gpus):
+        gpu_ids.put(i)
+    logger.info(f"Processing on {n_gpus} GPUs")
+    with ProcessPoolExecutor(
+        max_workers=n_gpus,
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(gpu_ids,),
+    ) as pool:
+        list(pool.map(_process_in_worker, files, [f in new_files for f in files]))
+
+
+# Bound parameters per IN (...) query; stays under SQLite's older 999 limit
+_IN_BATCH = 500
+
+
+def _recorded_paths(session, paths: list[str]) -> set[str]:
+    """Those of *paths* that have a recording row, in batched IN queries."""
+    recorded: set[str] = set()
+    for i in range(0, len(paths), _IN_BATCH):
+        recorded.update(
+            session.scalars(
+                select(Recording.filepath).where(
+                    Recording.filepath.in_(paths[i : i + _IN_BATCH])
+                )
+            )
+        )
+    return recorded
 
 
-def process_all_unprocessed(watch_dir: Path):
-    """Process all .wav files in the directory that haven't been processed yet."""
-    from transcriptor.db.database import SessionLocal, init_db
-    from transcriptor.db.models import Recording
+def process_all_unprocessed(watch_dir: Path, pipeline=None):
+    """Process all .wav files in the directory that haven't been processed yet.
 
+    Files are taken smallest first, so short calls are not held up behind
+    long ones.  On a multi-GPU machine (and without a caller-supplied
+    *pipeline*) they are spread over one worker process per GPU; otherwise
+    over ``WATCHER_WORKERS`` threads sharing one pipeline.
+    """
     _setup_logging(Path("logs"))
     init_db()
 
     session = SessionLocal()
-    processed_files = {r.filename for r in session.query(Recording).filter(Recording.status == "done").all()}
-    session.close()
+    processed_files = set(
+        session.scalars(select(Recording.filename).where(Recording.status == "done"))
+    )
 
-    wav_files = sorted(watch_dir.glob("*.wav"))
-    unprocessed = [f for f in wav_files if f.name not in processed_files]
+    # One scandir pass; DirEntry.is_file() uses the type from the listing
+    # itself, so already-done files cost no stat() or Path object
+    with os.scandir(watch_dir) as entries:
+        candidates = [
+            (entry.stat().st_size, entry.name, Path(entry.path))
+            for entry in entries
+            if entry.name.lower().endswith(".wav")
+            and entry.name not in processed_files
+            and entry.is_file()
+        ]
+    # Shortest job first: file size stands in for duration
+    candidates.sort()
+    unprocessed = [f for _, _, f in candidates]
 
     if not unprocessed:
+        session.close()
         logger.info("No unprocessed WAV files found.")
         return
 
+    # Which of them already have a (failed/pending) recording, so
+    # _process_file can skip its per-file lookup for the rest
+    recorded = _recorded_paths(session, [str(f) for f in unprocessed])
+    session.close()
+    new_files = {f for f in unprocessed if str(f) not in recorded}
+
     logger.info(f"Found {len(unprocessed)} unprocessed WAV file(s)")
-    for f in unprocessed:
-        _process_file(f)
+    if pipeline is None and len(unprocessed) > 1:
+        n_gpus = min(_gpu_count(), len(unprocessed))
+        if n_gpus > 1:
+            _process_on_gpus(unprocessed, new_files, n_gpus)
+            return
+
+    # One pipeline for the whole batch so models are loaded once
+    if pipeline is None:
+        pipeline = _shared_pipeline()
+        pipeline.warmup()
+
+    workers = min(max(settings.WATCHER_WORKERS, 1), len(unprocessed))
+    if workers > 1:
+        # Each worker decodes its own file, overlapping the others' inference
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="process") as pool:
+            futures = [
+                pool.submit(_process_file, f, pipeline, known_new=f in new_files)
+                for f in unprocessed
+            ]
+            for future in futures:
+                future.result()  # re-raise failures _process_file lets through
+        return
+
+    # Decode file N+1 on a worker thread while file N runs through the models
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch") as pool:
+        next_audio = pool.submit(pipeline.prefetch_audio, unprocessed[0])
+        for i, f in enumerate(unprocessed):
+            try:
+                audio = next_audio.result()
+            except Exception as e:
+                # Let _process_file decode (and report) it the normal way
+                logger.warning(f"Prefetch failed for {f.name}: {e}")
+                audio = None
+            if i + 1 < len(unprocessed):
+                next_audio = pool.submit(pipeline.prefetch_audio, unprocessed[i + 1])
+            _process_file(f, pipeline, audio, known_new=f in new_files)
+
+
+def _check_inotify_limit() -> None:
+    """Log the kernel's inotify event queue limit (Linux only).
+
+    Events beyond it are dropped, and watchdog does not report the overflow,
+    so files arriving in a burst can go unnoticed.
+    """
+    try:
+        with open("/proc/sys/fs/inotify/max_queued_events") as f:
+            limit = int(f.read())
+    except (OSError, ValueError):
+        return
+    logger.info(
+        f"inotify max_queued_events={limit}; for very busy folders raise it "
+        "(sysctl fs.inotify.max_queued_events) or set WATCHER_RESCAN_SECONDS"
+    )
+
+
+def _rescan(watch_dir: Path, handler: WavFileHandler) -> None:
+    """Hand *handler* the WAV files in *watch_dir* no event told it about.
+
+    Only files without any recording row are picked up, so failed ones are
+    not retried on every sweep.  They still go through the settle timer, in
+    case they are being written.
+    """
+    with os.scandir(watch_dir) as entries:
+        paths = [
+            entry.path
+            for entry in entries
+            if _is_wav(entry.name) and entry.is_file()
+        ]
+    if not paths:
+        return
+    session = SessionLocal()
+    try:
+        recorded = _recorded_paths(session, paths)
+    finally:
+        session.close()
+    for path_str in paths:
+        if path_str in recorded:
+            continue
+        path = Path(path_str)
+        if not handler.is_pending(path):
+            logger.info(f"Rescan found {path.name}")
+            handler.schedule_file(path)
 
 
 def start_watcher(watch_dir: Path):
     """Start the folder watcher on the given directory."""
     _setup_logging(Path("logs"))
 
-    from transcriptor.db.database import init_db
-
     init_db()
 
     watch_dir.mkdir(parents=True, exist_ok=True)
-    processing_queue: queue.Queue[Path] = queue.Queue()
+    # SimpleQueue: its put() is safe to call from the signal handler below
+    processing_queue: queue.SimpleQueue[Path | None] = queue.SimpleQueue()
     handler = WavFileHandler(processing_queue)
     observer = Observer()
     observer.schedule(handler, str(watch_dir), recursive=False)
     observer.start()
     logger.info(f"Watching {watch_dir} for new WAV files... (Ctrl+C to stop)")
+    _check_inotify_limit()
+
+    # Fallback for events lost to an inotify queue overflow
+    stop_rescan = threading.Event()
+    if settings.WATCHER_RESCAN_SECONDS > 0:
+
+        def _rescan_loop():
+            while not stop_rescan.wait(settings.WATCHER_RESCAN_SECONDS):
+                try:
+                    _rescan(watch_dir, handler)
+                except Exception as e:
+                    logger.warning(f"Rescan of {watch_dir} failed: {e}")
+
+        threading.Thread(target=_rescan_loop, name="watcher-rescan", daemon=True).start()
+
+    stop = threading.Event()
+
+    def _request_stop(signum, frame):
+        # Take no more files; those already being processed are finished
+        # first.  A second Ctrl+C raises KeyboardInterrupt here, but worker
+        # threads still finish their current file before the process exits.
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        stop.set()
+        processing_queue.put(None)  # wake the loop if it is waiting
+
+    # Several files at once, so one long recording does not hold up the rest.
+    # At most two per worker are handed to the pool; the rest wait in
+    # processing_queue and are left there on stop.
+    workers = max(settings.WATCHER_WORKERS, 1)
+    slots = threading.BoundedSemaphore(workers * 2)
+
+    def _work(file_path: Path):
+        # Handed to the pool but not started before stop: leave it
+        if stop.is_set():
+            return
+        handler.mark_started(file_path)
+        _process_file(file_path, pipeline)
 
+    previous_handler = signal.signal(signal.SIGINT, _request_stop)
     try:
-        while True:
-            try:
-                file_path = processing_queue.get(timeout=1)
-                # Brief delay to let the file finish writing
-                time.sleep(1)
-                _process_file(file_path)
-            except queue.Empty:
-                continue
-    except KeyboardInterrupt:
+        # The observer is already running, so files arriving while the
+        # models load are queued rather than missed
+        try:
+            pipeline = _shared_pipeline()
+            pipeline.warmup()
+        except Exception:
+            logger.exception("Could not load the transcription models")
+            raise
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="watcher") as pool:
+            while True:
+                file_path = processing_queue.get()
+                if file_path is None or stop.is_set():
+                    break
+                slots.acquire()
+                if stop.is_set():
+                    break
+                future = pool.submit(_work, file_path)
+                future.add_done_callback(lambda _: slots.release())
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
         logger.info("Stopping watcher...")
+        stop_rescan.set()
         observer.stop()
-    observer.join()
+        observer.join()